@@ -26,19 +26,20 @@ def collect_repo_activity_counts(
 ) -> Dict[str, int]:
     """Run github_repo_user_report analysis and return summary counts."""
     analyzer = GitHubRepoUserAnalyzer(owner, repo, username, token, base_url=api_url)
-    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
-        analyzer.analyze_activity(
-            window.days,
-            window.end_exclusive,
-            window.cutoff,
-        )
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            analyzer.analyze_activity(
+                window.days,
+                window.end_exclusive,
+                window.cutoff,
+            )
+    finally:
+        analyzer.close()
     return {
-        "prs_merged": len(analyzer.stats["pull_requests_merged"]),
-        "reviews": analyzer.stats.get(
-            "total_reviews_given", len(analyzer.stats["pull_requests_reviewed"])
-        ),
-        "issues_opened": len(analyzer.stats["issues_opened"]),
-        "issues_closed": len(analyzer.stats["issues_closed"]),
+        "prs_merged": len(analyzer.stats.pull_requests_merged),
+        "reviews": analyzer.stats.total_reviews_given,
+        "issues_opened": len(analyzer.stats.issues_opened),
+        "issues_closed": len(analyzer.stats.issues_closed),
     }
 
 
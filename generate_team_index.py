@@ -6,13 +6,58 @@ Scans reports/team/ directory for HTML reports and creates an index.html
 with a table showing all metrics from each report.
 """
 
+import argparse
+import html
 import os
 import re
+import sys
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 from html.parser import HTMLParser
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+try:
+    # Optional C-backed parser; the stdlib ReportMetricsParser below is the fallback.
+    # selectolax >= 1.0 only ships the lexbor backend (selectolax.parser raises ImportError).
+    from selectolax.lexbor import LexborHTMLParser as FastParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as FastParser
+    except ImportError:
+        FastParser = None
+
+try:
+    import orjson
+
+    def _load_json(path: Path):
+        return orjson.loads(path.read_bytes())
+except ImportError:
+    def _load_json(path: Path):
+        return json.loads(path.read_bytes())
+
+_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+# Same date, but exactly one match per line (group 1 is None when a line has no date),
+# so a newline-joined batch of filenames maps back 1:1.
+_DATE_LINE_RE = re.compile(r'^(?:.*?(\d{4}-\d{2}-\d{2}))?.*$', re.MULTILINE)
+# Metric cells keep sign/thousands separators; aggregation wants bare digits.
+_CLEAN_SIGNED = re.compile(r'[^\d+\-,]')
+_CLEAN_UINT = re.compile(r'[^\d]')
+# Label canonicalization: drop emoji, punctuation and "(group)"-style suffixes.
+_CANON_STRIP = re.compile(r'\([^)]*\)|[^a-z ]')
+
+# Index column -> canonical metric-card label (see _canonical_label).
+_METRIC_LABELS = {
+    'prs_merged': 'prs merged',
+    'reviews': 'reviews given',
+    'issues_opened': 'issues opened',
+    'issues_closed': 'issues closed',
+    'pages_migrated': 'pg migrated',
+    'lines_added': 'lines added',
+    'lines_deleted': 'lines deleted',
+}
 
 
 def load_user_display_names(path: Path) -> Dict[str, str]:
@@ -21,8 +66,7 @@ def load_user_display_names(path: Path) -> Dict[str, str]:
     Supports schema with 'people'[].accounts[] or legacy flat { "login": "Name" }.
     """
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _load_json(path)
     except Exception:
         return {}
     if isinstance(data, dict) and "people" in data:
@@ -41,6 +85,21 @@ def load_user_display_names(path: Path) -> Dict[str, str]:
     return {}
 
 
+# One linear scan over the fixed markup github_repo_user_report.py emits:
+# <div class="repo">, <div class="username"> and each metric-label/metric-value pair.
+_EXTRACT = re.compile(
+    rb'<div class="(repo|username|metric-label|metric-value)"[^>]*>\s*([^<]*?)\s*<'
+)
+
+
+# Metric cards in a github_repo_user_report.py HTML report (4 headline + 4 collaboration).
+_EXPECTED_METRICS = 8
+
+
+class _StopParsing(Exception):
+    """Raised by ReportMetricsParser once every field has been captured."""
+
+
 class ReportMetricsParser(HTMLParser):
     """Parse HTML report to extract metrics"""
     
@@ -58,24 +117,26 @@ class ReportMetricsParser(HTMLParser):
         self.repo_name = None
         
     def handle_starttag(self, tag, attrs):
-        attrs_dict = dict(attrs)
+        # Only <div class="..."> matters; skip everything else before touching attrs
+        if tag != 'div':
+            return
+        cls = None
+        for name, value in attrs:
+            if name == 'class':
+                cls = value
+        if cls is None:
+            return
         
-        # Check for repo div
-        if tag == 'div' and attrs_dict.get('class') == 'repo':
+        if cls == 'repo':
             self.in_repo_div = True
-        
-        # Check for username div
-        if tag == 'div' and attrs_dict.get('class') == 'username':
+        elif cls == 'username':
             self.in_username_div = True
-        
-        # Check for metric cards
-        if tag == 'div' and attrs_dict.get('class') == 'metric-card':
+        elif cls == 'metric-card':
             self.in_metric_card = True
-        
-        if self.in_metric_card:
-            if tag == 'div' and attrs_dict.get('class') == 'metric-label':
+        elif self.in_metric_card:
+            if cls == 'metric-label':
                 self.in_metric_label = True
-            elif tag == 'div' and attrs_dict.get('class') == 'metric-value':
+            elif cls == 'metric-value':
                 self.in_metric_value = True
     
     def handle_endtag(self, tag):
@@ -93,6 +154,10 @@ class ReportMetricsParser(HTMLParser):
                 self.current_label = None
     
     def handle_data(self, data):
+        # Most text (CSS, headings, PR titles) sits outside the divs we capture
+        if not (self.in_repo_div or self.in_username_div
+                or self.in_metric_label or self.in_metric_value):
+            return
         data = data.strip()
         if not data:
             return
@@ -113,37 +178,108 @@ class ReportMetricsParser(HTMLParser):
             self.current_label = data
         elif self.in_metric_value and self.current_label:
             self.metrics[self.current_label] = data
+            # Everything after the metric cards is narrative (PR/issue lists)
+            if len(self.metrics) >= _EXPECTED_METRICS and self.username and self.repo_owner:
+                raise _StopParsing
+
+
+def _canonical_label(label: str) -> str:
+    """'📄 Pg Migrated (group)' -> 'pg migrated'."""
+    return ' '.join(_CANON_STRIP.sub('', label.lower()).split())
 
 
-def parse_report_file(filepath: Path) -> Optional[Dict]:
-    """Parse a single report HTML file and extract metrics"""
+def _scrape_report_fields(content: bytes) -> Tuple[Optional[str], Optional[str], Dict[str, str]]:
+    """Regex fast path for _extract_report_fields on well-formed reports."""
+    repo = username = label = None
+    metrics: Dict[str, str] = {}
+    for m in _EXTRACT.finditer(content):
+        text = m.group(2).decode('utf-8')
+        if '&' in text:
+            text = html.unescape(text)
+        cls = m.group(1)
+        if cls == b'metric-value':
+            if label:
+                metrics[label] = text
+            label = None
+        elif cls == b'metric-label':
+            label = text
+        elif cls == b'repo':
+            if repo is None and len(text.split('/')) == 2:
+                repo = text
+        elif username is None:
+            username = text.lstrip('@') or None
+    return repo, username, metrics
+
+
+def _extract_report_fields(content: bytes) -> Tuple[Optional[str], Optional[str], Dict[str, str]]:
+    """Return (repo, username, metrics) from raw report HTML.
+
+    Uses selectolax CSS selectors when installed (it takes the bytes as-is),
+    otherwise decodes and runs ReportMetricsParser. Both are only a fallback for
+    files the _EXTRACT scan cannot read (hand-edited or truncated reports).
+    """
+    repo, username, metrics = _scrape_report_fields(content)
+    if repo and username and metrics:
+        return repo, username, metrics
+
+    if FastParser is None:
+        parser = ReportMetricsParser()
+        try:
+            parser.feed(content.decode('utf-8'))
+        except _StopParsing:
+            pass
+        repo = f"{parser.repo_owner}/{parser.repo_name}" if parser.repo_owner else None
+        return repo, parser.username, parser.metrics
+
+    tree = FastParser(content)
+    repo = None
+    node = tree.css_first('div.repo')
+    if node is not None:
+        text = node.text(strip=True)
+        if len(text.split('/')) == 2:
+            repo = text
+    username = None
+    node = tree.css_first('div.username')
+    if node is not None:
+        username = node.text(strip=True).lstrip('@') or None
+    metrics: Dict[str, str] = {}
+    for card in tree.css('div.metric-card'):
+        label = card.css_first('div.metric-label')
+        value = card.css_first('div.metric-value')
+        if label is not None and value is not None:
+            metrics[label.text(strip=True)] = value.text(strip=True)
+    return repo, username, metrics
+
+
+# Below this many files, process start-up costs more than the parsing it saves.
+_PARALLEL_MIN_FILES = 16
+
+# Bump when the parse_report_file result shape changes so old caches are ignored.
+_PARSE_CACHE_VERSION = 1
+
+
+def parse_report_file(filepath: Path, name: str, report_date: str) -> Optional[Dict]:
+    """Parse a single report HTML file and extract metrics.
+
+    name and report_date are resolved by main() (see _report_dates) so workers
+    never touch pathlib accessors or stat() again.
+    """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
+        with open(filepath, 'rb') as f:
             content = f.read()
         
-        parser = ReportMetricsParser()
-        parser.feed(content)
+        repo, username, metrics = _extract_report_fields(content)
         
-        if not parser.username or not parser.repo_owner:
+        if not username or not repo:
             return None
         
-        # Extract date from filename or use file modification time
-        # Expected format: username-repo_name-yyyy-mm-dd.html
-        filename = filepath.stem
-        date_match = re.search(r'(\d{4}-\d{2}-\d{2})', filename)
-        if date_match:
-            report_date = date_match.group(1)
-        else:
-            # Use file modification time
-            mtime = filepath.stat().st_mtime
-            report_date = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d')
-        
         return {
-            'filename': filepath.name,
+            'filename': name,
             'date': report_date,
-            'username': parser.username,
-            'repo': f"{parser.repo_owner}/{parser.repo_name}",
-            'metrics': parser.metrics
+            'username': username,
+            'repo': repo,
+            'metrics': metrics,
+            'metrics_canon': {_canonical_label(k): v for k, v in metrics.items()},
         }
     
     except Exception as e:
@@ -151,13 +287,134 @@ def parse_report_file(filepath: Path) -> Optional[Dict]:
         return None
 
 
-def _get_metric_int(metrics: Dict, label_pattern: str) -> int:
+def _intern_report(report: Dict) -> Dict:
+    """Intern the strings repeated across reports (logins, repos, labels) in place.
+
+    Done in the parent process: interning inside pool workers or before a
+    cache round-trip would not survive pickling/JSON.
+    """
+    report['username'] = sys.intern(report['username'])
+    report['repo'] = sys.intern(report['repo'])
+    for field in ('metrics', 'metrics_canon'):
+        report[field] = {sys.intern(k): sys.intern(v) for k, v in report[field].items()}
+    return report
+
+
+def _report_dates(stems: List[str], mtimes: List[float]) -> List[str]:
+    """Report date per file: YYYY-MM-DD from the filename, else the file's mtime.
+
+    Expected filename format: username-repo_name-yyyy-mm-dd.html. All stems are
+    scanned in one finditer pass over a newline-joined string.
+    """
+    matches = list(_DATE_LINE_RE.finditer('\n'.join(stems)))
+    if len(matches) == len(stems):
+        found = [m.group(1) for m in matches]
+    else:
+        # A stem containing a newline would break the 1:1 mapping; go file by file
+        found = [m.group(1) if (m := _DATE_RE.search(stem)) else None for stem in stems]
+    return [
+        date or datetime.fromtimestamp(mtime).strftime('%Y-%m-%d')
+        for date, mtime in zip(found, mtimes)
+    ]
+
+
+def _prefetch_files(paths: List[Path]) -> None:
+    """Queue kernel readahead for every file up front (posix_fadvise WILLNEED).
+
+    The reads are then serviced concurrently by the OS instead of one blocking
+    open+read at a time inside the parse loop. No-op where fadvise is unavailable.
+    """
+    fadvise = getattr(os, 'posix_fadvise', None)
+    if fadvise is None:
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _load_parse_cache(path: Path) -> Dict[str, Dict]:
+    """Load {filename: {'key': [mtime_ns, size], 'data': parsed}} from a previous run."""
+    try:
+        data = _load_json(path)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('version') != _PARSE_CACHE_VERSION:
+        return {}
+    files = data.get('files')
+    return files if isinstance(files, dict) else {}
+
+
+def _split_cached(
+    html_files: List[Path], cache: Dict[str, Dict]
+) -> Tuple[Dict[str, Dict], List[Path], List[str], List[str], List[float]]:
+    """Carry over parsed entries whose (mtime_ns, size) still match; list the rest to parse.
+
+    Returns (new_cache, paths, names, stems, mtimes). Stale files get a
+    {'key': ...} entry whose 'data' the caller fills in after parsing (or drops,
+    if the parse failed); their path pieces are taken apart once here, not in
+    the workers.
+    """
+    new_cache: Dict[str, Dict] = {}
+    paths: List[Path] = []
+    names: List[str] = []
+    stems: List[str] = []
+    mtimes: List[float] = []
+    for html_file in html_files:
+        name = html_file.name
+        st = html_file.stat()
+        key = [st.st_mtime_ns, st.st_size]
+        entry = cache.get(name)
+        # Only successful parses are reused; a failed one may have been a transient read error
+        if isinstance(entry, dict) and entry.get('key') == key and entry.get('data'):
+            new_cache[name] = entry
+        else:
+            new_cache[name] = {'key': key}
+            paths.append(html_file)
+            names.append(name)
+            stems.append(html_file.stem)
+            mtimes.append(st.st_mtime)
+    return new_cache, paths, names, stems, mtimes
+
+
+def _save_parse_cache(path: Path, files: Dict[str, Dict]) -> None:
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'version': _PARSE_CACHE_VERSION, 'files': files}, f)
+    except OSError as e:
+        print(f"Warning: Could not write {path.name}: {e}")
+
+
+# Metric values repeat heavily across reports ('0', '+12', ...), so memoize the
+# cleaning instead of running the regex engine for every cell.
+@lru_cache(maxsize=4096)
+def _clean_signed(value: str) -> str:
+    return _CLEAN_SIGNED.sub('', value) or '0'
+
+
+@lru_cache(maxsize=4096)
+def _clean_uint(value: str) -> str:
+    return _CLEAN_UINT.sub('', value) or '0'
+
+
+def _find_metric(metrics_canon: Dict[str, str], key: str, clean=_clean_signed) -> str:
+    """Value of the _METRIC_LABELS[key] card, passed through clean ('0' if absent)."""
+    value = metrics_canon.get(_METRIC_LABELS[key])
+    if not value:
+        return '0'
+    return clean(value)
+
+
+def _get_metric_int(metrics_canon: Dict[str, str], key: str) -> int:
     """Get a metric value as int (for aggregation)."""
-    for key, value in metrics.items():
-        if label_pattern in key:
-            clean_value = re.sub(r'[^\d]', '', value)
-            return int(clean_value) if clean_value else 0
-    return 0
+    return int(_find_metric(metrics_canon, key, _clean_uint))
 
 
 def _latest_pages_migrated_total(reports: List[Dict]) -> int:
@@ -172,189 +429,182 @@ def _latest_pages_migrated_total(reports: List[Dict]) -> int:
         repo = report['repo']
         if repo not in latest_by_repo or report['date'] > latest_by_repo[repo]['date']:
             latest_by_repo[repo] = report
-    return sum(_get_metric_int(r['metrics'], 'Pg Migrated') for r in latest_by_repo.values())
+    return sum(_get_metric_int(r['metrics_canon'], 'pages_migrated') for r in latest_by_repo.values())
 
 
-def generate_index_html(reports: List[Dict], output_path: Path, pages_migrated: int = 0):
-    """Generate index.html with table of all reports"""
-    
-    # Sort reports by date (newest first), then by username
-    reports.sort(key=lambda x: (x['date'], x['username']), reverse=True)
-    
-    # Total PRs merged across all reports (for first stat-card)
-    total_prs_merged = sum(_get_metric_int(r['metrics'], 'PRs Merged') for r in reports)
-    
-    html = """<!DOCTYPE html>
+# Static page pieces, written as plain strings (CSS braces need no escaping).
+# The *_TMPL pieces have no literal '%' and take %-style values.
+_INDEX_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Team Activity Reports Index</title>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
             background: linear-gradient(135deg, oklch(from #667eea 0.7 0.15 260) 0%, oklch(from #764ba2 0.6 0.18 300) 100%);
             min-height: 100vh;
             padding: 40px 20px;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
-        }}
+        }
         
-        .header {{
+        .header {
             background: white;
             border-radius: 16px;
             padding: 40px;
             margin-bottom: 30px;
             box-shadow: 0 10px 40px oklch(from #000000 1 0 0 / 0.1);
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             font-size: 2.5em;
             color: oklch(from #1f2937 0.3 0 0);
             margin-bottom: 10px;
-        }}
+        }
         
-        .header p {{
+        .header p {
             font-size: 1.1em;
             color: oklch(from #6b7280 0.5 0 0);
-        }}
+        }
         
-        .stats {{
+        .stats {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             margin-top: 20px;
-        }}
+        }
         
-        .stat-card {{
+        .stat-card {
             background: oklch(from #f3f4f6 0.96 0 0);
             padding: 20px;
             border-radius: 12px;
             text-align: center;
-        }}
+        }
         
-        .stat-value {{
+        .stat-value {
             font-size: 2em;
             font-weight: bold;
             color: oklch(from #667eea 0.6 0.15 260);
-        }}
+        }
         
-        .stat-label {{
+        .stat-label {
             font-size: 0.9em;
             color: oklch(from #6b7280 0.5 0 0);
             margin-top: 5px;
-        }}
+        }
         
-        .table-container {{
+        .table-container {
             background: white;
             border-radius: 16px;
             padding: 30px;
             box-shadow: 0 10px 40px oklch(from #000000 1 0 0 / 0.1);
             overflow-x: auto;
-        }}
+        }
         
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             font-size: 0.95em;
-        }}
+        }
         
-        thead {{
+        thead {
             background: oklch(from #f9fafb 0.98 0 0);
             position: sticky;
             top: 0;
-        }}
+        }
         
-        th {{
+        th {
             padding: 16px 12px;
             text-align: left;
             font-weight: 600;
             color: oklch(from #374151 0.35 0 0);
             border-bottom: 2px solid oklch(from #e5e7eb 0.92 0 0);
             white-space: nowrap;
-        }}
+        }
         
-        td {{
+        td {
             padding: 14px 12px;
             border-bottom: 1px solid oklch(from #f3f4f6 0.96 0 0);
             color: oklch(from #1f2937 0.3 0 0);
-        }}
+        }
         
-        tbody tr {{
+        tbody tr {
             transition: background-color 0.2s;
-        }}
+        }
         
-        tbody tr:hover {{
+        tbody tr:hover {
             background: oklch(from #f9fafb 0.98 0 0);
-        }}
+        }
         
-        .username-link {{
+        .username-link {
             color: oklch(from #667eea 0.6 0.15 260);
             text-decoration: none;
             font-weight: 600;
             transition: color 0.2s;
-        }}
+        }
         
-        .username-link:hover {{
+        .username-link:hover {
             color: oklch(from #764ba2 0.5 0.18 300);
             text-decoration: underline;
-        }}
+        }
         
-        .metric-cell {{
+        .metric-cell {
             text-align: center;
             font-family: 'SF Mono', Monaco, 'Cascadia Code', monospace;
             font-size: 0.9em;
-        }}
+        }
         
-        .date-cell {{
+        .date-cell {
             font-weight: 500;
             color: oklch(from #4b5563 0.4 0 0);
-        }}
+        }
         
-        .repo-cell {{
+        .repo-cell {
             font-family: 'SF Mono', Monaco, 'Cascadia Code', monospace;
             font-size: 0.9em;
             color: oklch(from #6b7280 0.5 0 0);
-        }}
+        }
         
-        .positive {{
+        .positive {
             color: oklch(from #10b981 0.55 0.15 150);
-        }}
+        }
         
-        .negative {{
+        .negative {
             color: oklch(from #ef4444 0.55 0.2 25);
-        }}
+        }
         
-        .footer {{
+        .footer {
             text-align: center;
             color: white;
             margin-top: 30px;
             opacity: 0.9;
             font-size: 0.9em;
-        }}
+        }
         
-        @media (max-width: 768px) {{
-            .header h1 {{
+        @media (max-width: 768px) {
+            .header h1 {
                 font-size: 1.8em;
-            }}
+            }
             
-            table {{
+            table {
                 font-size: 0.85em;
-            }}
+            }
             
-            th, td {{
+            th, td {
                 padding: 10px 8px;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
@@ -364,16 +614,18 @@ def generate_index_html(reports: List[Dict], output_path: Path, pages_migrated:
             <p>Aggregated GitHub repository activity metrics</p>
             
             <div class="stats">
-                <div class="stat-card">
-                    <div class="stat-value">{total_prs_merged}</div>
+"""
+
+_INDEX_STATS_TMPL = """                <div class="stat-card">
+                    <div class="stat-value">%s</div>
                     <div class="stat-label">Total PRs Merged</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-value">{pages_migrated}</div>
+                    <div class="stat-value">%s</div>
                     <div class="stat-label">Pages Migrated</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-value">{unique_repos}</div>
+                    <div class="stat-value">%s</div>
                     <div class="stat-label">Repositories</div>
                 </div>
             </div>
@@ -391,7 +643,9 @@ def generate_index_html(reports: List[Dict], output_path: Path, pages_migrated:
                     </tr>
                 </thead>
                 <tbody>
-{summary_rows}
+"""
+
+_INDEX_MIDDLE = """
                 </tbody>
             </table>
         </div>
@@ -415,59 +669,117 @@ def generate_index_html(reports: List[Dict], output_path: Path, pages_migrated:
                 </thead>
                 <tbody>
 """
-    
-    # Calculate summary stats
-    unique_repos = len(set(r['repo'] for r in reports))
 
-    # Sort reports alphabetically by username
-    sorted_reports = sorted(reports, key=lambda r: r['username'].lower())
-    
-    # Add rows for each report
-    for report in sorted_reports:
-        metrics = report['metrics']
-        
-        # Extract metric values (handle various formats)
-        def get_metric_value(label_pattern):
-            for key, value in metrics.items():
-                if label_pattern in key:
-                    # Remove emoji and extra text, get just the number
-                    clean_value = re.sub(r'[^\d+\-,]', '', value)
-                    return clean_value if clean_value else '0'
-            return '0'
-        
-        prs_merged = get_metric_value('PRs Merged')
-        reviews = get_metric_value('Reviews Given')
-        issues_opened = get_metric_value('Issues Opened')
-        issues_closed = get_metric_value('Issues Closed')
-        pages_migrated_cell = get_metric_value('Pg Migrated')
-        lines_added = get_metric_value('Lines Added')
-        lines_deleted = get_metric_value('Lines Deleted')
-        
-        html += f"""                    <tr>
-                        <td class="date-cell">{report['date']}</td>
-                        <td><a href="team/{report['filename']}" class="username-link">@{report['username']}</a></td>
-                        <td class="repo-cell"><a href="https://github.com/{report['repo']}" target="_blank" rel="noopener">{report['repo']}</a></td>
-                        <td class="metric-cell">{prs_merged}</td>
-                        <td class="metric-cell">{reviews}</td>
-                        <td class="metric-cell">{issues_opened}</td>
-                        <td class="metric-cell">{issues_closed}</td>
-                        <td class="metric-cell">{pages_migrated_cell}</td>
-                        <td class="metric-cell positive">{lines_added}</td>
-                        <td class="metric-cell negative">{lines_deleted}</td>
-                    </tr>
-"""
-    
-    html += """                </tbody>
+_INDEX_FOOTER_TMPL = """                </tbody>
             </table>
         </div>
         
         <div class="footer">
-            <p>Generated on {current_date} | Click username to view detailed report</p>
+            <p>Generated on %s | Click username to view detailed report</p>
         </div>
     </div>
 </body>
 </html>
 """
+
+_INDEX_ROW_TMPL = """                    <tr>
+                        <td class="date-cell">%s</td>
+                        <td><a href="team/%s" class="username-link">@%s</a></td>
+                        <td class="repo-cell"><a href="https://github.com/%s" target="_blank" rel="noopener">%s</a></td>
+                        <td class="metric-cell">%s</td>
+                        <td class="metric-cell">%s</td>
+                        <td class="metric-cell">%s</td>
+                        <td class="metric-cell">%s</td>
+                        <td class="metric-cell">%s</td>
+                        <td class="metric-cell positive">%s</td>
+                        <td class="metric-cell negative">%s</td>
+                    </tr>
+"""
+
+# Low-activity weeks are common: same row with every cell after PRs Merged fixed at
+# zero (reports write zero line counts as +0 / -0).
+_INDEX_ZERO_ROW_TMPL = """                    <tr>
+                        <td class="date-cell">%s</td>
+                        <td><a href="team/%s" class="username-link">@%s</a></td>
+                        <td class="repo-cell"><a href="https://github.com/%s" target="_blank" rel="noopener">%s</a></td>
+                        <td class="metric-cell">%s</td>
+                        <td class="metric-cell">0</td>
+                        <td class="metric-cell">0</td>
+                        <td class="metric-cell">0</td>
+                        <td class="metric-cell">0</td>
+                        <td class="metric-cell positive">+0</td>
+                        <td class="metric-cell negative">-0</td>
+                    </tr>
+"""
+
+_INDEX_SUMMARY_ROW_TMPL = """                    <tr>
+                        <td class="date-cell">%s</td>
+                        <td>@%s</td>
+                        <td>%s</td>
+                        <td class="metric-cell">%s</td>
+                    </tr>
+"""
+
+
+def generate_index_html(reports: List[Dict], output_path: Path, pages_migrated: int = 0):
+    """Generate index.html with table of all reports"""
+    
+    # Sort reports by date (newest first), then by username
+    reports.sort(key=lambda x: (x['date'], x['username']), reverse=True)
+    
+    # Sort reports alphabetically by username
+    sorted_reports = sorted(reports, key=lambda r: r['username'].lower())
+    
+    # One pass: header stats, per-user summary and a row for each report
+    total_prs_merged = 0
+    repos = set()
+    # Per-user summary as parallel columns indexed through user_index
+    user_index: Dict[str, int] = {}
+    user_prs_merged: List[int] = []
+    user_latest_date: List[str] = []
+    row_parts: List[str] = []
+    for report in sorted_reports:
+        username = report['username']
+        metrics = report['metrics_canon']
+        
+        # Extract metric values (strip emoji and extra text, keep the number)
+        prs_merged = _find_metric(metrics, 'prs_merged')
+        reviews = _find_metric(metrics, 'reviews')
+        issues_opened = _find_metric(metrics, 'issues_opened')
+        issues_closed = _find_metric(metrics, 'issues_closed')
+        pages_migrated_cell = _find_metric(metrics, 'pages_migrated')
+        lines_added = _find_metric(metrics, 'lines_added')
+        lines_deleted = _find_metric(metrics, 'lines_deleted')
+        prs_merged_count = int(_clean_uint(prs_merged))
+        
+        total_prs_merged += prs_merged_count
+        repos.add(report['repo'])
+        i = user_index.get(username)
+        if i is None:
+            user_index[username] = len(user_prs_merged)
+            user_prs_merged.append(prs_merged_count)
+            user_latest_date.append(report['date'])
+        else:
+            user_prs_merged[i] += prs_merged_count
+            # Use the most recent date for this user
+            if report['date'] > user_latest_date[i]:
+                user_latest_date[i] = report['date']
+        
+        # Metric cells are already reduced to digits/sign/commas by _find_metric;
+        # only the free-text fields need escaping.
+        repo = html.escape(report['repo'])
+        filename = html.escape(report['filename'])
+        if (reviews == issues_opened == issues_closed == pages_migrated_cell == '0'
+                and lines_added == '+0' and lines_deleted == '-0'):
+            row_parts.append(_INDEX_ZERO_ROW_TMPL % (
+                report['date'], filename, html.escape(username), repo, repo, prs_merged,
+            ))
+        else:
+            row_parts.append(_INDEX_ROW_TMPL % (
+                report['date'], filename, html.escape(username), repo, repo,
+                prs_merged, reviews, issues_opened, issues_closed, pages_migrated_cell,
+                lines_added, lines_deleted,
+            ))
     
     # Load user names mapping
     user_names_file = Path(__file__).parent / "user_names.json"
@@ -478,60 +790,35 @@ def generate_index_html(reports: List[Dict], output_path: Path, pages_migrated:
         except Exception as e:
             print(f"Warning: Could not load user_names.json: {e}")
     
-    # Calculate summary by user
-    from collections import defaultdict
-    user_summary = defaultdict(lambda: {'prs_merged': 0, 'date': None})
+    # Summary rows are produced lazily while the file is being written
+    def iter_summary_rows():
+        for username in sorted(user_index):
+            i = user_index[username]
+            real_name = user_names.get(username, username)  # Fall back to username if not found
+            yield _INDEX_SUMMARY_ROW_TMPL % (
+                user_latest_date[i], html.escape(username), html.escape(real_name), user_prs_merged[i],
+            )
     
-    for report in reports:
-        username = report['username']
-        metrics = report['metrics']
-        
-        # Extract PRs Merged value
-        def get_metric_value(label_pattern):
-            for key, value in metrics.items():
-                if label_pattern in key:
-                    # Remove emoji and extra text, get just the number
-                    clean_value = re.sub(r'[^\d]', '', value)
-                    return int(clean_value) if clean_value else 0
-            return 0
-        
-        prs_merged = get_metric_value('PRs Merged')
-        user_summary[username]['prs_merged'] += prs_merged
-        
-        # Use the most recent date for this user
-        if user_summary[username]['date'] is None or report['date'] > user_summary[username]['date']:
-            user_summary[username]['date'] = report['date']
-    
-    # Generate summary rows
-    summary_rows = ""
-    for username in sorted(user_summary.keys()):
-        summary = user_summary[username]
-        real_name = user_names.get(username, username)  # Fall back to username if not found
-        summary_rows += f"""                    <tr>
-                        <td class="date-cell">{summary['date']}</td>
-                        <td>@{username}</td>
-                        <td>{real_name}</td>
-                        <td class="metric-cell">{summary['prs_merged']}</td>
-                    </tr>
-"""
-    
-    # Fill in template variables
-    html = html.format(
-        total_prs_merged=total_prs_merged,
-        pages_migrated=pages_migrated,
-        unique_repos=unique_repos,
-        summary_rows=summary_rows,
-        current_date=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    )
-    
-    # Write to file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    # Stream the page to disk piece by piece instead of joining one big string.
+    # Individual rows stay materialized: the summary table above them needs
+    # every report before anything can be written.
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(_INDEX_HEAD)
+        f.write(_INDEX_STATS_TMPL % (total_prs_merged, pages_migrated, len(repos)))
+        f.writelines(iter_summary_rows())
+        f.write(_INDEX_MIDDLE)
+        f.writelines(row_parts)
+        f.write(_INDEX_FOOTER_TMPL % datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
     
     print(f"✓ Generated index with {len(reports)} reports")
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Build reports/index.html from reports/team/*.html")
+    parser.add_argument("-v", "--verbose", action="store_true", help="List each report file as it is parsed")
+    parser.add_argument("--no-cache", action="store_true", help="Reparse every report instead of reusing reports/.index_cache.json")
+    args = parser.parse_args()
+
     # Define paths
     team_dir = Path(__file__).parent / 'reports' / 'team'
     reports_dir = Path(__file__).parent / 'reports'
@@ -552,13 +839,33 @@ def main():
     
     print(f"Found {len(html_files)} report(s)")
     
-    # Parse all reports
-    reports = []
-    for html_file in html_files:
-        print(f"  Parsing {html_file.name}...")
-        report_data = parse_report_file(html_file)
-        if report_data:
-            reports.append(report_data)
+    # Reuse results for files whose (mtime, size) match the previous run
+    cache_path = reports_dir / '.index_cache.json'
+    cache = {} if args.no_cache else _load_parse_cache(cache_path)
+    new_cache, paths, names, stems, mtimes = _split_cached(html_files, cache)
+    
+    if paths:
+        print(f"Parsing {len(paths)} new or changed report(s)")
+        _prefetch_files(paths)
+    dates = _report_dates(stems, mtimes)
+    
+    # Parse remaining reports (each file is independent, so fan out across cores)
+    if len(paths) >= _PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor() as executor:
+            parsed = list(executor.map(parse_report_file, paths, names, dates, chunksize=8))
+    else:
+        parsed = [parse_report_file(*entry) for entry in zip(paths, names, dates)]
+    
+    for name, report_data in zip(names, parsed):
+        if args.verbose:
+            print(f"  Parsed {name}")
+        if report_data is None:
+            del new_cache[name]  # not cached, so the file is retried next run
+        else:
+            new_cache[name]['data'] = report_data
+    _save_parse_cache(cache_path, new_cache)
+    
+    reports = [_intern_report(new_cache[f.name]['data']) for f in html_files if f.name in new_cache]
     
     if not reports:
         print("⚠️  No valid reports could be parsed")
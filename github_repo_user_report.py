@@ -8,19 +8,788 @@ This is more accurate than the Events API for tracking work on specific projects
 
 import argparse
 import json
+import os
 import sys
+import threading
+import time
+from bisect import bisect_right
 from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # Optional: on-disk HTTP cache for --http-cache
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+
+# Optional faster decoder for API response bodies; falls back to requests' own .json().
+try:
+    import orjson
+
+    def _json(response):
+        return orjson.loads(response.content)
+
+    def _dump_dataclass(obj) -> str:
+        # orjson serializes dataclasses and datetimes natively, no asdict() copy needed
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _json(response):
+        return response.json()
+
+    def _dump_dataclass(obj) -> str:
+        # Raw UTF-8 like orjson, so the report does not depend on which one is installed
+        return json.dumps(asdict(obj), indent=2, ensure_ascii=False)
+
+
+# html.escape(s, quote=True) as a str.translate table: one C-level pass per string.
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+
+def _fmt_day(day: str) -> str:
+    """'2026-05-04' (or any string starting with that) -> 'May 04, 2026'."""
+    return f"{_MONTHS[int(day[5:7]) - 1]} {day[8:10]}, {day[:4]}"
+
+
+def _fmt_date(value: str) -> str:
+    """GitHub timestamp -> 'May 04, 2026' (strftime('%B %d, %Y') without the parse)."""
+    if value.endswith("Z") and len(value) >= 10:
+        # UTC "YYYY-MM-DDTHH:MM:SSZ": the calendar date can be read straight off the string
+        return _fmt_day(value)
+    dt = _parse_gh_dt(value)
+    return f"{_MONTHS[dt.month - 1]} {dt.day:02d}, {dt.year}"
+
+
+def _first_line(text: Optional[str], limit: int = 120) -> str:
+    """First non-blank line of text, capped at limit characters, with '...' when anything was cut."""
+    if not text:
+        return ""
+    # Leading blank lines would otherwise leave an empty preview
+    text = text.strip()
+    end = text.find("\n")
+    end = limit if end < 0 else min(end, limit)
+    return text[:end] + "..." if len(text) > end else text
+
+
+# PR size by total changes (additions + deletions): < 10 xs, 10-29 s, 30-99 m,
+# 100-499 l, 500-999 xl, >= 1000 xxl.
+_PR_SIZE_BOUNDS = (10, 30, 100, 500, 1000)
+_PR_SIZE_NAMES = ("xs", "s", "m", "l", "xl", "xxl")
+_PR_SIZE_LABELS = {name: name.upper() for name in _PR_SIZE_NAMES}
+
+
+def _pr_size(changes: int) -> str:
+    """Categorize PR size based on total changes (additions + deletions)"""
+    return _PR_SIZE_NAMES[bisect_right(_PR_SIZE_BOUNDS, changes)]
+
+
+def _parse_gh_dt(value: str) -> datetime:
+    """Parse a GitHub API timestamp ("2026-05-04T13:00:00Z"); much cheaper than strptime."""
+    return datetime.fromisoformat(value[:-1] if value.endswith("Z") else value)
+
+
+# --http-cache: responses are reused for an hour, and revalidated with ETag /
+# Last-Modified after that (a 304 does not count against the rate limit). GitHub's
+# own Cache-Control (max-age=60, no-cache on search) is deliberately not honoured.
+_HTTP_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".gh_report_cache")
+_HTTP_CACHE_EXPIRE_SECONDS = 3600
+# Without requests-cache, --http-cache keeps only ETags + bodies in this sidecar file.
+_ETAG_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".gh_etag_cache.json")
+
+# Rate-limit handling in _request: slow down when a resource's remaining quota drops
+# below _RATE_LIMIT_LOW_WATER, and wait out 403/429 rate-limit responses (at most
+# _RATE_LIMIT_RETRIES times, never sleeping longer than _RATE_LIMIT_MAX_SLEEP seconds).
+_RATE_LIMIT_LOW_WATER = 10
+_RATE_LIMIT_RETRIES = 3
+_RATE_LIMIT_MAX_SLEEP = 900
+
+# Concurrent per-item REST calls; kept low to stay clear of GitHub's secondary rate limits.
+_MAX_FETCH_WORKERS = 16
+
+# Merged-PR search with the fields the REST per-pull GET used to supply.
+_MERGED_PRS_GRAPHQL = """
+query($q: String!, $after: String) {
+  search(type: ISSUE, query: $q, first: 100, after: $after) {
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      ... on PullRequest {
+        number title url state createdAt updatedAt mergedAt closedAt
+        additions deletions changedFiles
+        commits { totalCount }
+        author { login }
+      }
+    }
+  }
+}
+"""
+
+
+# Issues the user commented on, with their comments inline (replaces a GET per issue).
+_COMMENTED_ISSUES_GRAPHQL = """
+query($q: String!, $after: String) {
+  search(type: ISSUE, query: $q, first: 100, after: $after) {
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      ... on Issue {
+        number title url state
+        comments(last: 100) { nodes { author { login } createdAt body } }
+      }
+    }
+  }
+}
+"""
+
+# Closed issues with their close events inline, so the closer is known without
+# a GET /issues/{n}/events per issue (list/search responses carry no closed_by).
+_CLOSED_ISSUES_GRAPHQL = """
+query($q: String!, $after: String) {
+  search(type: ISSUE, query: $q, first: 100, after: $after) {
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      ... on Issue {
+        number title url state createdAt closedAt
+        comments { totalCount }
+        timelineItems(itemTypes: [CLOSED_EVENT], last: 10) {
+          nodes { ... on ClosedEvent { actor { login } createdAt } }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Reviews for up to _REVIEW_BATCH_SIZE PRs are fetched per GraphQL request, one alias each.
+# GraphQL has no author filter on reviews, so the user's reviews are still picked in Python.
+_REVIEW_BATCH_SIZE = 20
+_PR_REVIEWS_GRAPHQL_FIELDS = "number reviews(first: 100) { nodes { author { login } state submittedAt body } }"
+
+
+# Static stylesheet for _generate_html_report (kept out of the f-string so it is not
+# re-scanned per report and needs no {{ }} escaping).
+_CSS = """\
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+        
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            line-height: 1.6;
+            color: #24292f;
+            background: linear-gradient(135deg, #f6f8fa 0%, #ffffff 100%);
+            padding: 20px;
+        }
+        
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 12px;
+            box-shadow: 0 4px 6px #0000001a;
+            overflow: hidden;
+        }
+        
+        .header {
+            background: linear-gradient(135deg, #0366d6 0%, #0969da 100%);
+            color: white;
+            padding: 40px;
+            text-align: center;
+        }
+        
+        .header h1 {
+            font-size: 2.5em;
+            margin-bottom: 10px;
+            font-weight: 700;
+        }
+        
+        .header .repo {
+            font-size: 1.5em;
+            margin-bottom: 10px;
+            opacity: 0.95;
+            font-family: 'Monaco', monospace;
+        }
+        
+        .header .username {
+            font-size: 1.3em;
+            margin-bottom: 15px;
+            opacity: 0.9;
+        }
+        
+        .header .meta {
+            font-size: 0.95em;
+            opacity: 0.85;
+        }
+        
+        .metrics-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+            padding: 40px;
+            background: #f8f9fa;
+        }
+        
+        .metric-card {
+            background: white;
+            padding: 25px;
+            border-radius: 10px;
+            text-align: center;
+            border: 2px solid #e9ecef;
+            transition: all 0.3s ease;
+        }
+        
+        .metric-card:hover {
+            transform: translateY(-5px);
+            box-shadow: 0 8px 15px #0000001a;
+            border-color: #0366d6;
+        }
+        
+        .metric-value {
+            font-size: 3em;
+            font-weight: 700;
+            margin: 10px 0;
+            background: linear-gradient(135deg, #0366d6, #0969da);
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+            background-clip: text;
+        }
+        
+        .metric-label {
+            color: #6c757d;
+            font-size: 0.95em;
+            text-transform: uppercase;
+            letter-spacing: 1px;
+            font-weight: 600;
+        }
+        
+        .section {
+            padding: 40px;
+        }
+        
+        .section-title {
+            font-size: 1.8em;
+            margin-bottom: 25px;
+            color: #1f2937;
+            border-bottom: 3px solid #0366d6;
+            padding-bottom: 10px;
+            display: flex;
+            align-items: center;
+            gap: 10px;
+        }
+        
+        .pr-card {
+            background: white;
+            border: 1px solid #e9ecef;
+            border-radius: 8px;
+            padding: 20px;
+            margin-bottom: 20px;
+            transition: all 0.3s ease;
+        }
+        
+        .pr-card:hover {
+            box-shadow: 0 4px 12px #0000001a;
+            border-color: #0366d6;
+        }
+        
+        .pr-title {
+            font-size: 1.2em;
+            font-weight: 600;
+            color: #1f2937;
+            margin-bottom: 10px;
+            display: flex;
+            align-items: center;
+            gap: 10px;
+        }
+        
+        .pr-number {
+            color: #0366d6;
+            font-weight: 700;
+        }
+        
+        .pr-stats {
+            display: flex;
+            gap: 20px;
+            margin-top: 15px;
+            padding-top: 15px;
+            border-top: 1px solid #e9ecef;
+            flex-wrap: wrap;
+        }
+        
+        .pr-stat {
+            display: flex;
+            align-items: center;
+            gap: 5px;
+            font-size: 0.9em;
+        }
+        
+        .stat-additions {
+            color: #22c55e;
+            font-weight: 600;
+        }
+        
+        .stat-deletions {
+            color: #ef4444;
+            font-weight: 600;
+        }
+        
+        .pr-link {
+            color: #0366d6;
+            text-decoration: none;
+            font-weight: 500;
+        }
+        
+        .pr-link:hover {
+            text-decoration: underline;
+        }
+        
+        .badge {
+            display: inline-block;
+            padding: 4px 12px;
+            border-radius: 12px;
+            font-size: 0.85em;
+            font-weight: 600;
+            text-transform: uppercase;
+        }
+        
+        .badge-merged {
+            background: #22c55e1a;
+            color: #16a34a;
+        }
+        
+        .badge-open {
+            background: #3b82f61a;
+            color: #2563eb;
+        }
+        
+        .badge-closed {
+            background: #ef44441a;
+            color: #dc2626;
+        }
+        
+        .badge-approved {
+            background: #22c55e1a;
+            color: #16a34a;
+        }
+        
+        .badge-changes-requested {
+            background: #ef44441a;
+            color: #dc2626;
+        }
+        
+        .badge-commented {
+            background: #3b82f61a;
+            color: #2563eb;
+        }
+        
+        .badge-size {
+            font-size: 0.75em;
+            padding: 3px 8px;
+            margin-left: 8px;
+        }
+        
+        .badge-xs {
+            background: #10b98126;
+            color: #059669;
+        }
+        
+        .badge-s {
+            background: #3b82f626;
+            color: #2563eb;
+        }
+        
+        .badge-m {
+            background: #f59e0b26;
+            color: #d97706;
+        }
+        
+        .badge-l {
+            background: #f9731626;
+            color: #ea580c;
+        }
+        
+        .badge-xl {
+            background: #ef444426;
+            color: #dc2626;
+        }
+        
+        .badge-xxl {
+            background: #991b1b33;
+            color: #7f1d1d;
+            font-weight: 700;
+        }
+        
+        .pr-size-chart {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(140px, 1fr));
+            gap: 15px;
+            margin-top: 20px;
+        }
+        
+        .size-card {
+            background: white;
+            padding: 20px;
+            border-radius: 8px;
+            text-align: center;
+            border: 2px solid #e9ecef;
+        }
+        
+        .size-label {
+            font-size: 0.85em;
+            color: #6c757d;
+            text-transform: uppercase;
+            font-weight: 600;
+            letter-spacing: 0.5px;
+            margin-bottom: 8px;
+        }
+        
+        .size-value {
+            font-size: 2.5em;
+            font-weight: 700;
+            margin: 5px 0;
+        }
+        
+        .size-description {
+            font-size: 0.75em;
+            color: #6c757d;
+            margin-top: 5px;
+        }
+        
+        @media (max-width: 768px) {
+            .metrics-grid {
+                grid-template-columns: 1fr;
+            }
+            
+            .header h1 {
+                font-size: 1.8em;
+            }
+        }"""
+
+
+# Static stretches of _generate_html_report's page around the dynamic parts.
+_HTML_STYLE = """    <style>
+""" + _CSS + """
+    </style>
+</head>
+<body>
+    <div class="container">
+"""
+_HTML_TAIL = """
+    </div>
+</body>
+</html>
+"""
+
+
+# Review state -> badge class on review cards; anything else renders as a comment.
+_REVIEW_BADGE = {
+    "APPROVED": "badge-approved",
+    "CHANGES_REQUESTED": "badge-changes-requested",
+    "COMMENTED": "badge-commented",
+}
+
+
+# Badge snippets shared by every card instead of being rebuilt per row. Issue states
+# other than "open" render as closed, matching the old inline conditional.
+_STATUS_BADGE = {
+    "open": '<span class="badge badge-open">🔓 Open</span>',
+    "closed": '<span class="badge badge-closed">✅ Closed</span>',
+}
+_SIZE_BADGE_HTML = {
+    size: sys.intern(f'<span class="badge badge-{size} badge-size">{_PR_SIZE_LABELS[size]}</span>')
+    for size in _PR_SIZE_NAMES
+}
+
+
+# Per-item cards for iter_html_report, filled with str.format_map.
+_PR_CARD_TMPL = """
+            <div class="pr-card">
+                <div class="pr-title">
+                    <span class="pr-number">#{number}</span>
+                    <a href="{url}" class="pr-link" target="_blank">{title}</a>
+                    <span class="badge badge-merged">✅ Merged</span>
+                    {size_badge}
+                </div>
+                <div class="pr-stats">
+                    <div class="pr-stat">📅 Merged {merged}</div>
+                    <div class="pr-stat">
+                        <span class="stat-additions">+{additions}</span>
+                    </div>
+                    <div class="pr-stat">
+                        <span class="stat-deletions">-{deletions}</span>
+                    </div>
+                    <div class="pr-stat">📊 {total} total changes</div>
+                    <div class="pr-stat">📄 {files} files</div>
+                    <div class="pr-stat">💾 {commits} commits</div>
+                </div>
+            </div>
+"""
+_CLOSED_ISSUE_CARD_TMPL = """
+            <div class="pr-card">
+                <div class="pr-title">
+                    <span class="pr-number">#{number}</span>
+                    <a href="{url}" class="pr-link" target="_blank">{title}</a>
+                    <span class="badge badge-closed">✅ Closed</span>
+                </div>
+                <div class="pr-stats">
+                    <div class="pr-stat">🔒 Closed: {date}</div>
+                    <div class="pr-stat">💬 {comments} comments</div>
+                </div>
+            </div>
+"""
+_REVIEW_CARD_TMPL = """
+            <div class="pr-card">
+                <div class="pr-title">
+                    <span class="pr-number">#{number}</span>
+                    <a href="{url}" class="pr-link" target="_blank">{title}</a>
+                    <span class="badge {badge_class}">{state}</span>
+                </div>
+                <div class="pr-stats">
+                    <div class="pr-stat">📅 {date}</div>
+                </div>
+            </div>
+"""
+_ISSUE_CARD_TMPL = """
+            <div class="pr-card">
+                <div class="pr-title">
+                    <span class="pr-number">#{number}</span>
+                    <a href="{url}" class="pr-link" target="_blank">{title}</a>
+                    {status_badge}
+                </div>
+                <div class="pr-stats">
+                    <div class="pr-stat">📅 {date}</div>
+                    <div class="pr-stat">💬 {comments} comments</div>
+                </div>
+            </div>
+"""
+_COMMENT_CARD_TMPL = """
+            <div class="pr-card">
+                <div class="pr-title">
+                    <span class="pr-number">#{number}</span>
+                    <a href="{url}" class="pr-link" target="_blank">{title}</a>
+                    {status_badge}
+                </div>
+                <div class="pr-stats">
+                    <div class="pr-stat">📅 {date}</div>
+                </div>
+                <div style="margin-top: 10px; padding: 10px; background: #f8f9fa; border-radius: 4px; font-size: 0.9em; color: #495057;">
+                    {preview}
+                </div>
+            </div>
+"""
+
+
+def _render_pr_card(
+    number: int,
+    url: str,
+    title: str,
+    size: str,
+    merged_at: str,
+    additions: int,
+    deletions: int,
+    total: int,
+    files: int,
+    commits: int,
+) -> str:
+    """One merged-PR card: escaped link, size badge and merge date filled into _PR_CARD_TMPL."""
+    if merged_at:
+        try:
+            merge_label = _fmt_date(merged_at)
+        except ValueError:
+            merge_label = merged_at[:10]
+    else:
+        merge_label = "—"
+    return _PR_CARD_TMPL.format_map({
+        "number": number,
+        "url": url.translate(_HTML_ESCAPE),
+        "title": title.translate(_HTML_ESCAPE),
+        "size_badge": _SIZE_BADGE_HTML[size],
+        "merged": merge_label,
+        "additions": additions,
+        "deletions": deletions,
+        "total": total,
+        "files": files,
+        "commits": commits,
+    })
+
+
+# Field dicts for the remaining card templates, one per row; iter_html_report joins
+# each section in one pass with "".join(map(template.format_map, ...)).
+def _closed_issue_card_fields(issues: List[Dict]) -> Iterator[Dict]:
+    esc = _HTML_ESCAPE
+    fmt_date = _fmt_date
+    for issue in issues:
+        yield {
+            "number": issue['number'],
+            "url": issue['url'].translate(esc),
+            "title": issue['title'].translate(esc),
+            "date": fmt_date(issue['closed_at']) if issue.get('closed_at') else 'Unknown',
+            "comments": issue['comments_count'],
+        }
+
+
+def _review_card_fields(reviews: List[Dict]) -> Iterator[Dict]:
+    esc = _HTML_ESCAPE
+    fmt_date = _fmt_date
+    for review in reviews:
+        review_state = review['state'].upper()
+        submitted_at = review.get('submitted_at')
+        yield {
+            "number": review['pr_number'],
+            "url": review['pr_url'].translate(esc),
+            "title": review['pr_title'].translate(esc),
+            "badge_class": _REVIEW_BADGE.get(review_state, 'badge-commented'),
+            "state": review_state,
+            "date": fmt_date(submitted_at) if submitted_at else "Unknown",
+        }
+
+
+def _issue_card_fields(issues: List[Dict]) -> Iterator[Dict]:
+    esc = _HTML_ESCAPE
+    fmt_date = _fmt_date
+    closed_badge = _STATUS_BADGE["closed"]
+    for issue in issues:
+        yield {
+            "number": issue['number'],
+            "url": issue['url'].translate(esc),
+            "title": issue['title'].translate(esc),
+            "status_badge": _STATUS_BADGE.get(issue["state"], closed_badge),
+            "date": fmt_date(issue['created_at']),
+            "comments": issue['comments_count'],
+        }
+
+
+def _comment_card_fields(comments: List[Dict]) -> Iterator[Dict]:
+    esc = _HTML_ESCAPE
+    fmt_date = _fmt_date
+    closed_badge = _STATUS_BADGE["closed"]
+    for comment in comments:
+        yield {
+            "number": comment['issue_number'],
+            "url": comment['issue_url'].translate(esc),
+            "title": comment['issue_title'].translate(esc),
+            "status_badge": _STATUS_BADGE.get(comment["issue_state"], closed_badge),
+            "date": fmt_date(comment['created_at']),
+            "preview": _first_line(comment['body'], 100).translate(esc),
+        }
+
+
+def _empty_pr_sizes() -> Dict[str, int]:
+    return {
+        "xs": 0,   # < 10 changes
+        "s": 0,    # 10-29 changes
+        "m": 0,    # 30-99 changes
+        "l": 0,    # 100-499 changes
+        "xl": 0,   # 500-999 changes
+        "xxl": 0,  # >= 1000 changes
+    }
+
+
+@dataclass(slots=True)
+class RepoStats:
+    """Everything analyze_activity collects; field order is the JSON report's key order."""
+    pull_requests_opened: List[Dict] = field(default_factory=list)
+    pull_requests_merged: List[Dict] = field(default_factory=list)
+    pull_requests_closed: List[Dict] = field(default_factory=list)
+    pull_requests_reviewed: List[Dict] = field(default_factory=list)
+    issues_opened: List[Dict] = field(default_factory=list)
+    issues_closed: List[Dict] = field(default_factory=list)
+    issue_comments: List[Dict] = field(default_factory=list)
+    review_comments_given: int = 0
+    total_additions: int = 0
+    total_deletions: int = 0
+    total_files_changed: int = 0
+    pr_sizes: Dict[str, int] = field(default_factory=_empty_pr_sizes)
+    total_commits_in_prs: int = 0
+    total_reviews_given: int = 0
+    unique_prs_reviewed: int = 0
+    unique_issues_commented: int = 0
+
+
+class _ETagCacheAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that sends If-None-Match for GETs it has seen before and turns a
+    304 back into the stored 200 body. GitHub does not count 304s against the
+    rate limit. Entries are written to `path` when the adapter is closed; only the
+    URLs requested during this run are kept, so old date windows do not pile up.
+    """
+
+    def __init__(self, path: str, **kwargs):
+        super().__init__(**kwargs)
+        self._path = path
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._used = set()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def send(self, request, **kwargs):
+        key = request.url if request.method == "GET" else None
+        entry = self._entries.get(key) if key else None
+        if key:
+            with self._lock:
+                self._used.add(key)
+        if entry:
+            request.headers["If-None-Match"] = entry["etag"]
+        response = super().send(request, **kwargs)
+        if entry and response.status_code == 304:
+            response.status_code = 200
+            response._content = entry["body"].encode("utf-8")
+            response.encoding = "utf-8"
+        elif key and response.status_code == 200 and response.headers.get("ETag"):
+            # API bodies are UTF-8 JSON; decode directly rather than via response.text,
+            # which may run charset detection over multi-megabyte search pages
+            body = response.content.decode("utf-8")
+            with self._lock:
+                self._entries[key] = {"etag": response.headers["ETag"], "body": body}
+                self._dirty = True
+        return response
+
+    def close(self):
+        stale = self._entries.keys() - self._used
+        if stale:
+            for key in stale:
+                del self._entries[key]
+            self._dirty = True
+        if self._dirty:
+            try:
+                with open(self._path, "w", encoding="utf-8") as f:
+                    json.dump(self._entries, f)
+                self._dirty = False
+            except OSError as e:
+                print(f"Warning: Could not write {self._path}: {e}")
+        super().close()
 
 
 class GitHubRepoUserAnalyzer:
-    def __init__(self, owner: str, repo: str, username: str, github_token: Optional[str] = None, base_url: Optional[str] = None):
+    def __init__(
+        self,
+        owner: str,
+        repo: str,
+        username: str,
+        github_token: Optional[str] = None,
+        base_url: Optional[str] = None,
+        http_cache: bool = False,
+    ):
         self.owner = owner
         self.repo = repo
         self.username = username
+        self._ulogin = username.lower()  # logins compare case-insensitively
         self.base_url = (base_url or "").rstrip("/") or "https://api.github.com"
         self.headers = {
             "Accept": "application/vnd.github+json",
@@ -28,44 +797,102 @@ class GitHubRepoUserAnalyzer:
         }
         if github_token:
             self.headers["Authorization"] = f"Bearer {github_token}"
-        
-        self.stats = {
-            "pull_requests_opened": [],
-            "pull_requests_merged": [],
-            "pull_requests_closed": [],
-            "pull_requests_reviewed": [],
-            "issues_opened": [],
-            "issues_closed": [],
-            "issue_comments": [],
-            "review_comments_given": 0,
-            "total_additions": 0,
-            "total_deletions": 0,
-            "total_files_changed": 0,
-            "pr_sizes": {
-                "xs": 0,   # < 10 changes
-                "s": 0,    # 10-29 changes
-                "m": 0,    # 30-99 changes
-                "l": 0,    # 100-499 changes
-                "xl": 0,   # 500-999 changes
-                "xxl": 0,  # >= 1000 changes
-            }
-        }
-    
-    def _get_pr_size(self, changes: int) -> str:
-        """Categorize PR size based on total changes (additions + deletions)"""
-        if changes < 10:
-            return "xs"
-        elif changes < 30:
-            return "s"
-        elif changes < 100:
-            return "m"
-        elif changes < 500:
-            return "l"
-        elif changes < 1000:
-            return "xl"
+        # One pooled keep-alive session for every call (incl. the worker threads);
+        # transient 5xx responses are retried with exponential back-off. Rate limits
+        # (403/429) are left to _request, which caps the wait and reports it.
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+            respect_retry_after_header=False,
+            allowed_methods=["GET", "POST"],  # POST is only used for read-only GraphQL
+            raise_on_status=False,
+        )
+        pool = {"pool_connections": 32, "pool_maxsize": 32, "max_retries": retry}
+        if http_cache and CachedSession is not None:
+            # GET only: GraphQL POSTs are never served from the cache
+            self._session = CachedSession(
+                _HTTP_CACHE_PATH,
+                expire_after=_HTTP_CACHE_EXPIRE_SECONDS,
+                allowable_methods=["GET"],
+            )
+            adapter = HTTPAdapter(**pool)
         else:
-            return "xxl"
+            self._session = requests.Session()
+            # No requests-cache: still revalidate with ETags so unchanged pages cost nothing
+            adapter = _ETagCacheAdapter(_ETAG_CACHE_PATH, **pool) if http_cache else HTTPAdapter(**pool)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update(self.headers)
+        
+        self.stats = RepoStats()
+        # X-RateLimit-Reset of the last "not waiting" warning, so it is printed once per window
+        self._rate_limit_warned: Optional[str] = None
+        # Report window, set by analyze_activity (None until then)
+        self.since_date: Optional[datetime] = None
+        self.end_date: Optional[datetime] = None
     
+    def close(self) -> None:
+        """Close the HTTP session (and persist the --http-cache ETag file, if used)."""
+        self._session.close()
+
+    @staticmethod
+    def _rate_limit_wait(response: requests.Response) -> Optional[float]:
+        """Seconds to wait before the next call on this resource, or None to carry on."""
+        if getattr(response, "from_cache", False):
+            return None  # replayed headers from --http-cache say nothing about the live quota
+        headers = response.headers
+        retry_after = headers.get("Retry-After")
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if response.status_code in (403, 429):
+            if retry_after and retry_after.isdigit():
+                return float(retry_after)
+            if remaining == "0" and reset and reset.isdigit():
+                return max(0.0, int(reset) - time.time()) + 1
+            return None  # a plain 403 (permissions), not a rate limit
+        # Malformed (e.g. proxy-rewritten) headers are ignored rather than raising
+        if (
+            remaining and remaining.isdigit() and reset and reset.isdigit()
+            and int(remaining) < _RATE_LIMIT_LOW_WATER
+        ):
+            return max(0.0, int(reset) - time.time()) + 1
+        return None
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        GET/POST through the shared session, honouring GitHub's rate-limit headers:
+        sleeps until X-RateLimit-Reset when the quota is nearly used up, and retries
+        rate-limited 403/429 responses after Retry-After (urllib3's Retry handles 5xx).
+        """
+        send = self._session.post if method == "POST" else self._session.get
+        for attempt in range(_RATE_LIMIT_RETRIES + 1):
+            response = send(url, **kwargs)
+            wait = self._rate_limit_wait(response)
+            if wait is None:
+                return response
+            if wait > _RATE_LIMIT_MAX_SLEEP:
+                # Every later call in the same window would say the same; warn once per reset
+                window = response.headers.get("X-RateLimit-Reset") or response.headers.get("Retry-After")
+                if window != self._rate_limit_warned:
+                    self._rate_limit_warned = window
+                    print(f"  Rate limit resets in {wait:.0f}s; not waiting.")
+                return response
+            limited = response.status_code in (403, 429)
+            if limited and attempt == _RATE_LIMIT_RETRIES:
+                return response
+            print(f"  Rate limit {'hit' if limited else 'nearly used up'}; waiting {wait:.0f}s...")
+            time.sleep(wait)
+            if not limited:
+                return response
+        return response
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        return self._request("GET", url, **kwargs)
+
+    def _post(self, url: str, **kwargs) -> requests.Response:
+        return self._request("POST", url, **kwargs)
+
     def _search_issues_paginated(
         self,
         query: str,
@@ -85,11 +912,11 @@ class GitHubRepoUserAnalyzer:
                 "per_page": 100,
                 "page": page,
             }
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self._get(url, params=params)
             if response.status_code != 200:
                 print(f"Error searching issues: {response.status_code} - {response.text[:500]}")
                 break
-            data = response.json()
+            data = _json(response)
             batch = data.get("items", [])
             if not batch:
                 break
@@ -98,6 +925,125 @@ class GitHubRepoUserAnalyzer:
                 break
         return all_items
 
+    def _search_issues_pages(
+        self,
+        query: str,
+        pages: int = 3,
+        *,
+        sort: str = "updated",
+        order: str = "desc",
+    ) -> List[List[Dict]]:
+        """
+        Fetch up to `pages` Search pages and return them in page order, stopping at the
+        first failed, empty or short page. Page 1 is fetched alone; only the further
+        pages its total_count says exist are then requested, concurrently.
+        """
+        url = f"{self.base_url}/search/issues"
+
+        def fetch(page: int):
+            params = {"q": query, "sort": sort, "order": order, "per_page": 100, "page": page}
+            return self._get(url, params=params)
+
+        batches: List[List[Dict]] = []
+
+        def take(response) -> Optional[Dict]:
+            if response.status_code != 200:
+                print(f"Error searching issues: {response.status_code} - {response.text[:500]}")
+                return None
+            data = _json(response)
+            batch = data.get("items", [])
+            if not batch:
+                return None
+            batches.append(batch)
+            return data if len(batch) == 100 else None
+
+        first = take(fetch(1))
+        if first is None:
+            return batches
+        last_page = min(pages, -(-first.get("total_count", 0) // 100))
+        if last_page < 2:
+            return batches
+        with ThreadPoolExecutor(max_workers=last_page - 1) as executor:
+            responses = list(executor.map(fetch, range(2, last_page + 1)))
+        for response in responses:
+            if take(response) is None:
+                break
+        return batches
+
+    def _graphql_url(self) -> str:
+        """GraphQL endpoint for base_url (Enterprise: /api/v3 -> /api/graphql)."""
+        if self.base_url.endswith("/api/v3"):
+            return self.base_url[: -len("v3")] + "graphql"
+        return f"{self.base_url}/graphql"
+
+    def _graphql(self, query: str, variables: Dict) -> Optional[Dict]:
+        """POST a GraphQL query; returns `data`, or None so callers can fall back to REST."""
+        if "Authorization" not in self.headers:
+            return None  # GraphQL requires a token
+        try:
+            response = self._post(
+                self._graphql_url(),
+                json={"query": query, "variables": variables},
+                timeout=60,
+            )
+        except requests.RequestException as exc:
+            print(f"  GraphQL request failed: {exc}")
+            return None
+        if response.status_code != 200:
+            print(f"  GraphQL error: {response.status_code} - {response.text[:300]}")
+            return None
+        payload = _json(response)
+        if payload.get("errors") or not payload.get("data"):
+            print(f"  GraphQL error: {str(payload.get('errors'))[:300]}")
+            return None
+        return payload["data"]
+
+    def _graphql_search_nodes(self, query: str, search_q: str, max_pages: int = 10) -> Optional[List[Dict]]:
+        """Follow `search` pageInfo cursors up to max_pages × 100 nodes (None on GraphQL failure)."""
+        nodes: List[Dict] = []
+        after = None
+        for _ in range(max_pages):
+            data = self._graphql(query, {"q": search_q, "after": after})
+            if data is None:
+                return None
+            search = data["search"]
+            nodes.extend(n for n in search["nodes"] if n)
+            page_info = search["pageInfo"]
+            if not page_info["hasNextPage"]:
+                break
+            after = page_info["endCursor"]
+        return nodes
+
+    @staticmethod
+    def _pr_from_graphql(node: Dict) -> Dict:
+        """Map a GraphQL PullRequest node onto the REST pull fields analyze_activity reads."""
+        return {
+            "number": node["number"],
+            "title": node["title"],
+            "html_url": node["url"],
+            # REST reports merged pulls as "closed"
+            "state": "open" if node["state"] == "OPEN" else "closed",
+            "created_at": node["createdAt"],
+            "updated_at": node["updatedAt"],
+            "closed_at": node.get("closedAt"),
+            "merged_at": node.get("mergedAt"),
+            "additions": node.get("additions", 0),
+            "deletions": node.get("deletions", 0),
+            "changed_files": node.get("changedFiles", 0),
+            "commits": (node.get("commits") or {}).get("totalCount", 0),
+            "user": {"login": (node.get("author") or {}).get("login", "")},
+        }
+
+    def _graphql_merged_prs(self, since_s: str, end_s: str) -> Optional[List[Dict]]:
+        """Merged PRs in the window with size/commit fields inline (no per-PR REST GET)."""
+        nodes = self._graphql_search_nodes(
+            _MERGED_PRS_GRAPHQL,
+            f"repo:{self.owner}/{self.repo} is:pr is:merged merged:{since_s}..{end_s}",
+        )
+        if nodes is None:
+            return None
+        return [self._pr_from_graphql(n) for n in nodes if "number" in n]
+
     @staticmethod
     def _isoformat_z(dt: datetime) -> str:
         """GitHub API timestamp with UTC Z suffix."""
@@ -129,12 +1075,12 @@ class GitHubRepoUserAnalyzer:
                 "per_page": 100,
                 "page": page,
             }
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self._get(url, params=params)
             if response.status_code != 200:
                 print(f"Error listing issues: {response.status_code} - {response.text[:500]}")
                 return None
 
-            batch = response.json()
+            batch = _json(response)
             if not batch:
                 break
 
@@ -149,7 +1095,7 @@ class GitHubRepoUserAnalyzer:
                     continue
                 if issue.get("pull_request"):
                     continue
-                if (issue.get("user") or {}).get("login", "").lower() != self.username.lower():
+                if (issue.get("user") or {}).get("login", "").lower() != self._ulogin:
                     continue
                 number = issue.get("number")
                 if number in seen_numbers:
@@ -169,6 +1115,9 @@ class GitHubRepoUserAnalyzer:
         """YYYY-MM-DD in UTC for merged_at (API returns Zulu)."""
         if not merged_at:
             return None
+        # API timestamps are already UTC ("...Z"); the date is the first 10 characters
+        if merged_at.endswith("Z") and len(merged_at) >= 11 and merged_at[10] == "T":
+            return merged_at[:10]
         try:
             s = merged_at.replace("Z", "+00:00") if merged_at.endswith("Z") else merged_at
             dt = datetime.fromisoformat(s)
@@ -226,9 +1175,8 @@ class GitHubRepoUserAnalyzer:
         """GET /repos/{owner}/{repo}/pulls state=closed (fallback when Search is empty)."""
         out: List[Dict] = []
         for page in range(1, max_pages + 1):
-            r = requests.get(
+            r = self._get(
                 f"{self.base_url}/repos/{self.owner}/{self.repo}/pulls",
-                headers=self.headers,
                 params={
                     "state": "closed",
                     "per_page": 100,
@@ -241,7 +1189,7 @@ class GitHubRepoUserAnalyzer:
             if r.status_code != 200:
                 print(f"  List pulls error: {r.status_code} - {r.text[:300]}")
                 break
-            batch = r.json()
+            batch = _json(r)
             if not batch:
                 break
             out.extend(batch)
@@ -260,6 +1208,18 @@ class GitHubRepoUserAnalyzer:
         print(f"Fetching PRs merged by @{self.username} in {self.owner}/{self.repo}...")
         since_s, end_s = self._report_day_strings(since_date, end_date)
 
+        # One GraphQL search page carries additions/deletions/commits for 100 PRs.
+        # An empty result still goes through REST, which retries the looser queries.
+        graphql_prs = self._graphql_merged_prs(since_s, end_s)
+        if graphql_prs:
+            prs = [
+                pr for pr in graphql_prs
+                if pr["user"]["login"].lower() == self._ulogin
+                and since_s <= (self._merged_at_calendar_day_utc(pr["merged_at"]) or "") <= end_s
+            ]
+            print(f"  GraphQL: {len(graphql_prs)} merged PR(s), {len(prs)} by @{self.username}")
+            return prs
+
         summaries = self._search_merged_prs_in_window(since_s, end_s)
         source = "search"
         if not summaries:
@@ -277,7 +1237,7 @@ class GitHubRepoUserAnalyzer:
                 day = self._merged_at_calendar_day_utc(merged_at)
                 if not day or not (since_s <= day <= end_s):
                     continue
-                if (pr.get("user") or {}).get("login", "").lower() != self.username.lower():
+                if (pr.get("user") or {}).get("login", "").lower() != self._ulogin:
                     continue
                 seen_nums.add(n)
                 summaries.append({"number": n})
@@ -298,7 +1258,7 @@ class GitHubRepoUserAnalyzer:
             pr_number = pr_summary["number"]
             # Search issue objects include user + closed_at — skip non-matches before GET
             u = (pr_summary.get("user") or {}).get("login", "")
-            if u and u.lower() != self.username.lower():
+            if u and u.lower() != self._ulogin:
                 continue
             ca = pr_summary.get("closed_at")
             if ca:
@@ -306,106 +1266,172 @@ class GitHubRepoUserAnalyzer:
                 if not (since_s <= cday <= end_s):
                     continue
             pr_url = f"{self.base_url}/repos/{self.owner}/{self.repo}/pulls/{pr_number}"
-            pr_response = requests.get(pr_url, headers=self.headers, timeout=60)
+            pr_response = self._get(pr_url, timeout=60)
             if pr_response.status_code != 200:
                 continue
-            pr = pr_response.json()
+            pr = _json(pr_response)
             merged_at = pr.get("merged_at")
             day = self._merged_at_calendar_day_utc(merged_at)
             if not day or not (since_s <= day <= end_s):
                 continue
-            if (pr.get("user") or {}).get("login", "").lower() != self.username.lower():
+            if (pr.get("user") or {}).get("login", "").lower() != self._ulogin:
                 continue
             detailed_prs.append(pr)
 
         print(f"  After merged_at + author filter: {len(detailed_prs)} PR(s)")
         return detailed_prs
     
+    def _closed_by_user_in_window(self, events: List[Dict], since_s: str, end_s: str) -> bool:
+        """True if any REST-shaped `closed` event was by this user on a UTC day in [since_s, end_s]."""
+        for event in events:
+            if event.get("event") == "closed" and (event.get("actor") or {}).get("login", "").lower() == self._ulogin:
+                created_at = event.get("created_at")
+                close_day = self._merged_at_calendar_day_utc(created_at) if created_at else None
+                if close_day and since_s <= close_day <= end_s:
+                    return True
+        return False
+
+    def _graphql_closed_issues(self, query: str, since_s: str, end_s: str) -> Optional[List[Dict]]:
+        """Issues matching `query` that this user closed in the window, via one search (None on failure)."""
+        nodes = self._graphql_search_nodes(_CLOSED_ISSUES_GRAPHQL, f"{query} sort:updated-desc")
+        if nodes is None:
+            return None
+        issues = []
+        for node in nodes:
+            if "number" not in node:
+                continue
+            events = [
+                {"event": "closed", "actor": e.get("actor"), "created_at": e.get("createdAt")}
+                for e in node["timelineItems"]["nodes"]
+                if e
+            ]
+            if self._closed_by_user_in_window(events, since_s, end_s):
+                issues.append({
+                    "number": node["number"],
+                    "title": node["title"],
+                    "html_url": node["url"],
+                    "state": node["state"].lower(),
+                    "created_at": node.get("createdAt"),
+                    "closed_at": node.get("closedAt"),
+                    "comments": (node.get("comments") or {}).get("totalCount", 0),
+                })
+        return issues
+
+    def _fetch_issue_close_event(self, issue: Dict, since_s: str, end_s: str) -> Optional[Dict]:
+        """Return issue if this user closed it on a UTC day in [since_s, end_s], else None."""
+        events_url = f"{self.base_url}/repos/{self.owner}/{self.repo}/issues/{issue['number']}/events"
+        events_response = self._get(events_url)
+        if events_response.status_code != 200:
+            return None
+        # Check if this user closed the issue
+        return issue if self._closed_by_user_in_window(_json(events_response), since_s, end_s) else None
+
     def fetch_user_closed_issues(self, since_date: datetime, end_date: datetime) -> List[Dict]:
         """Fetch issues closed by the user in the repo"""
         print(f"Fetching issues closed by @{self.username} in {self.owner}/{self.repo}...")
         since_s, end_s = self._report_day_strings(since_date, end_date)
         query = f"repo:{self.owner}/{self.repo} is:issue is:closed closed:{since_s}..{end_s}"
+        
+        # GraphQL returns each issue's close events with the search hit
+        user_closed_issues = self._graphql_closed_issues(query, since_s, end_s)
+        if user_closed_issues is not None:
+            print(f"Found {len(user_closed_issues)} issues closed by user")
+            return user_closed_issues
+        
         all_issues = self._search_issues_paginated(
             query, max_pages=10, sort="updated", order="desc"
         )
 
         # Filter to only issues closed by this user
         # GitHub doesn't have a direct "closed-by" search filter, so we need to check events
-        user_closed_issues = []
-        for issue in all_issues:
-            issue_number = issue["number"]
-            events_url = f"{self.base_url}/repos/{self.owner}/{self.repo}/issues/{issue_number}/events"
-            events_response = requests.get(events_url, headers=self.headers)
-            
-            if events_response.status_code == 200:
-                events = events_response.json()
-                # Check if this user closed the issue
-                for event in events:
-                    if event.get("event") == "closed" and event.get("actor", {}).get("login", "").lower() == self.username.lower():
-                        created_at = event.get("created_at")
-                        close_day = self._merged_at_calendar_day_utc(created_at) if created_at else None
-                        if close_day and since_s <= close_day <= end_s:
-                            user_closed_issues.append(issue)
-                            break
+        # (one independent request per issue, so they run concurrently)
+        with ThreadPoolExecutor(max_workers=_MAX_FETCH_WORKERS) as executor:
+            results = executor.map(
+                lambda issue: self._fetch_issue_close_event(issue, since_s, end_s), all_issues
+            )
+            user_closed_issues = [issue for issue in results if issue is not None]
         
         print(f"Found {len(user_closed_issues)} issues closed by user")
         
         return user_closed_issues
     
+    def _graphql_reviews_by_pr(self, pr_numbers: List[int]) -> Optional[Dict[int, List[Dict]]]:
+        """
+        Reviews for many PRs via aliased `pullRequest(number:)` fields, _REVIEW_BATCH_SIZE
+        per request. Reviews are returned in the REST shape (user.login, state,
+        submitted_at, body); None means GraphQL is unavailable and REST should be used.
+        """
+        by_pr: Dict[int, List[Dict]] = {}
+        for start in range(0, len(pr_numbers), _REVIEW_BATCH_SIZE):
+            batch = pr_numbers[start:start + _REVIEW_BATCH_SIZE]
+            fields = "\n".join(
+                f"pr{i}: pullRequest(number: {n}) {{ {_PR_REVIEWS_GRAPHQL_FIELDS} }}"
+                for i, n in enumerate(batch)
+            )
+            query = (
+                "query($owner: String!, $name: String!) {\n"
+                f"  repository(owner: $owner, name: $name) {{\n{fields}\n  }}\n}}"
+            )
+            data = self._graphql(query, {"owner": self.owner, "name": self.repo})
+            if data is None:
+                return None
+            for node in (data.get("repository") or {}).values():
+                if not node:
+                    continue
+                by_pr[node["number"]] = [
+                    {
+                        "user": {"login": (r.get("author") or {}).get("login", "")},
+                        "state": r["state"],
+                        "submitted_at": r.get("submittedAt"),
+                        "body": r.get("body") or "",
+                    }
+                    for r in node["reviews"]["nodes"]
+                    if r
+                ]
+        return by_pr
+
     def fetch_user_reviews(self, since_date: datetime) -> List[Dict]:
         """Fetch reviews given by the user in the repo"""
         print(f"Fetching reviews by @{self.username} in {self.owner}/{self.repo}...")
         
         # Search for PRs where user has reviewed
-        # Note: GitHub search doesn't let us filter reviews by date directly,
-        # so we search for PRs and then filter the reviews by date
-        query = f"repo:{self.owner}/{self.repo} is:pr reviewed-by:{self.username}"
-        url = f"{self.base_url}/search/issues"
-        
-        all_reviews = []
-        page = 1
+        # Note: GitHub search doesn't let us filter reviews by date directly, so we
+        # search for PRs and then filter the reviews by date. Submitting a review
+        # bumps the PR's updated_at, so updated:>= drops no PR with an in-window review.
+        since_day = self._isoformat_z(since_date)[:10]
+        query = f"repo:{self.owner}/{self.repo} is:pr reviewed-by:{self.username} updated:>={since_day}"
         
-        while page <= 3:  # Get up to 300 PRs (3 pages * 100)
-            params = {
-                "q": query,
-                "sort": "updated",
-                "order": "desc",
-                "per_page": 100,
-                "page": page
-            }
-            
-            response = requests.get(url, headers=self.headers, params=params)
-            
-            if response.status_code != 200:
-                print(f"Error fetching reviewed PRs: {response.status_code}")
-                break
-            
-            data = response.json()
-            reviewed_prs = data.get("items", [])
-            
-            if not reviewed_prs:
-                break
-            
+        all_reviews = []
+        # Up to 300 PRs (3 pages * 100), requested together
+        for page, reviewed_prs in enumerate(self._search_issues_pages(query, pages=3), start=1):
             print(f"Found {len(reviewed_prs)} PRs on page {page}")
             
-            # Get review details for each PR
+            # Get review details for each PR: aliased GraphQL batches when possible
+            batched = self._graphql_reviews_by_pr([pr["number"] for pr in reviewed_prs])
             for pr in reviewed_prs:
                 pr_number = pr["number"]
-                reviews_url = f"{self.base_url}/repos/{self.owner}/{self.repo}/pulls/{pr_number}/reviews"
-                reviews_response = requests.get(reviews_url, headers=self.headers)
+                if batched is not None:
+                    reviews = batched.get(pr_number, [])
+                else:
+                    reviews_url = f"{self.base_url}/repos/{self.owner}/{self.repo}/pulls/{pr_number}/reviews"
+                    reviews_response = self._get(reviews_url)
+                    if reviews_response.status_code != 200:
+                        continue
+                    reviews = _json(reviews_response)
                 
-                if reviews_response.status_code == 200:
-                    reviews = reviews_response.json()
-                    # Filter to only this user's reviews
-                    user_reviews = [r for r in reviews if r["user"]["login"].lower() == self.username.lower()]
-                    for review in user_reviews:
-                        review["pr_number"] = pr_number
-                        review["pr_title"] = pr["title"]
-                        review["pr_url"] = pr["html_url"]
-                    all_reviews.extend(user_reviews)
-            
-            page += 1
+                # Keep this user's reviews, projected straight into the report shape
+                all_reviews.extend(
+                    {
+                        "pr_number": pr_number,
+                        "pr_title": pr["title"],
+                        "pr_url": pr["html_url"],
+                        "state": r["state"],
+                        "submitted_at": r.get("submitted_at"),
+                        "body": (r.get("body") or "")[:200],
+                    }
+                    for r in reviews
+                    if r["user"]["login"].lower() == self._ulogin
+                )
         
         print(f"Total reviews found: {len(all_reviews)}")
         return all_reviews
@@ -428,62 +1454,92 @@ class GitHubRepoUserAnalyzer:
         print(f"Found {len(issues)} issues")
         return issues
     
+    def _graphql_commented_issues(self, query: str) -> Optional[List[Dict]]:
+        """Search hits for `query` as REST-shaped issues, each with its comments under `_comments`."""
+        # Most recently updated first, like the REST search, so max_pages keeps the newest hits
+        nodes = self._graphql_search_nodes(
+            _COMMENTED_ISSUES_GRAPHQL, f"{query} sort:updated-desc", max_pages=3
+        )
+        if nodes is None:
+            return None
+        return [
+            {
+                "number": node["number"],
+                "title": node["title"],
+                "html_url": node["url"],
+                "state": node["state"].lower(),
+                "_comments": [
+                    {
+                        "user": {"login": (c.get("author") or {}).get("login", "")},
+                        "created_at": c.get("createdAt"),
+                        "body": c.get("body") or "",
+                    }
+                    for c in node["comments"]["nodes"]
+                    if c
+                ],
+            }
+            for node in nodes
+            if "number" in node
+        ]
+
     def fetch_user_issue_comments(self, since_date: datetime) -> List[Dict]:
         """Fetch issue comments made by the user in the repo"""
         print(f"Fetching issue comments by @{self.username} in {self.owner}/{self.repo}...")
         
-        # Search for issues (not PRs) where user has commented
-        query = f"repo:{self.owner}/{self.repo} is:issue commenter:{self.username}"
-        url = f"{self.base_url}/search/issues"
+        # Search for issues (not PRs) where user has commented (a new comment bumps updated_at)
+        since_day = self._isoformat_z(since_date)[:10]
+        query = f"repo:{self.owner}/{self.repo} is:issue commenter:{self.username} updated:>={since_day}"
         
-        all_comments = []
-        page = 1
+        # GraphQL returns each issue's comments with the search hit
+        issues = self._graphql_commented_issues(query)
+        if issues is None:
+            issues = [issue for batch in self._search_issues_pages(query, pages=3) for issue in batch]
+        print(f"Found {len(issues)} issues with comments")
         
-        while page <= 3:  # Get up to 300 issues
-            params = {
-                "q": query,
-                "sort": "updated",
-                "order": "desc",
-                "per_page": 100,
-                "page": page
-            }
-            
-            response = requests.get(url, headers=self.headers, params=params)
-            
-            if response.status_code != 200:
-                print(f"Error fetching issues with comments: {response.status_code}")
-                break
-            
-            data = response.json()
-            issues = data.get("items", [])
-            
-            if not issues:
-                break
-            
-            print(f"Found {len(issues)} issues with comments on page {page}")
-            
-            # Get comment details for each issue
-            for issue in issues:
-                issue_number = issue["number"]
+        all_comments = []
+        for issue in issues:
+            issue_number = issue["number"]
+            comments = issue.get("_comments")
+            if comments is None:
                 comments_url = f"{self.base_url}/repos/{self.owner}/{self.repo}/issues/{issue_number}/comments"
-                comments_response = requests.get(comments_url, headers=self.headers)
-                
-                if comments_response.status_code == 200:
-                    comments = comments_response.json()
-                    # Filter to only this user's comments
-                    user_comments = [c for c in comments if c["user"]["login"].lower() == self.username.lower()]
-                    for comment in user_comments:
-                        comment["issue_number"] = issue_number
-                        comment["issue_title"] = issue["title"]
-                        comment["issue_url"] = issue["html_url"]
-                        comment["issue_state"] = issue["state"]
-                    all_comments.extend(user_comments)
+                comments_response = self._get(comments_url)
+                if comments_response.status_code != 200:
+                    continue
+                comments = _json(comments_response)
             
-            page += 1
+            # Keep this user's comments, projected straight into the report shape
+            all_comments.extend(
+                {
+                    "issue_number": issue_number,
+                    "issue_title": issue["title"],
+                    "issue_url": issue["html_url"],
+                    "issue_state": issue["state"],
+                    "created_at": c.get("created_at"),
+                    "body": (c.get("body") or "")[:200],
+                }
+                for c in comments
+                if c["user"]["login"].lower() == self._ulogin
+            )
         
         print(f"Total issue comments found: {len(all_comments)}")
         return all_comments
     
+    def fetch_all_activity(self, since_date: datetime, end_date: datetime) -> Dict[str, List[Dict]]:
+        """Everything analyze_activity reports on, keyed by section.
+
+        The fetchers share no data, so they run concurrently (wall time is the
+        slowest fetcher rather than the sum); progress lines may interleave.
+        """
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = {
+                "prs": executor.submit(self.fetch_user_prs, since_date, end_date),
+                "reviews": executor.submit(self.fetch_user_reviews, since_date),
+                "issues": executor.submit(self.fetch_user_issues, since_date, end_date),
+                "closed_issues": executor.submit(self.fetch_user_closed_issues, since_date, end_date),
+                "issue_comments": executor.submit(self.fetch_user_issue_comments, since_date),
+            }
+            return {key: future.result() for key, future in futures.items()}
+    
     def analyze_activity(
         self,
         days: int,
@@ -508,14 +1564,20 @@ class GitHubRepoUserAnalyzer:
         self.end_date = end_date
         self.since_date = since_date
         
-        # Fetch PRs merged in [since_date, end_date] only (see fetch_user_prs)
-        prs = self.fetch_user_prs(since_date, self.end_date)
-        total_commits_in_prs = 0
+        activity = self.fetch_all_activity(since_date, self.end_date)
+        
+        # PRs merged in [since_date, end_date] only (see fetch_user_prs)
+        prs = activity["prs"]
+        # Locals for the per-PR loop; totals are folded back into stats afterwards
+        stats = self.stats
+        merged = stats.pull_requests_merged
+        sizes = stats.pr_sizes
+        total_commits_in_prs = add_sum = del_sum = files_sum = 0
         for pr in prs:
             additions = pr.get("additions", 0)
             deletions = pr.get("deletions", 0)
             total_changes = additions + deletions
-            pr_size = self._get_pr_size(total_changes)
+            pr_size = _pr_size(total_changes)
 
             pr_data = {
                 "number": pr["number"],
@@ -534,42 +1596,40 @@ class GitHubRepoUserAnalyzer:
                 "commits": pr.get("commits", 0),
             }
 
-            self.stats["pull_requests_merged"].append(pr_data)
+            merged.append(pr_data)
             total_commits_in_prs += pr_data["commits"]
-            self.stats["pr_sizes"][pr_size] += 1
-            self.stats["total_additions"] += additions
-            self.stats["total_deletions"] += deletions
-            self.stats["total_files_changed"] += pr_data["changed_files"]
-        
+            sizes[pr_size] += 1
+            add_sum += additions
+            del_sum += deletions
+            files_sum += pr_data["changed_files"]
+        
+        stats.total_additions += add_sum
+        stats.total_deletions += del_sum
+        stats.total_files_changed += files_sum
         # Store total commits in PRs
-        self.stats["total_commits_in_prs"] = total_commits_in_prs
+        stats.total_commits_in_prs = total_commits_in_prs
         
         since_s, end_s = self._report_day_strings(since_date, self.end_date)
-        # Fetch reviews
-        reviews = self.fetch_user_reviews(since_date)
+        # Reviews (the search's updated:>= only narrows the PRs; each PR still
+        # returns all of the user's reviews, including ones outside the window)
+        reviews = activity["reviews"]
+        reviewed = stats.pull_requests_reviewed
         for review in reviews:
             submitted_at = review.get("submitted_at")
             if submitted_at:
                 review_day = self._merged_at_calendar_day_utc(submitted_at)
                 if not review_day or not (since_s <= review_day <= end_s):
                     continue
-
-            review_data = {
-                "pr_number": review["pr_number"],
-                "pr_title": review["pr_title"],
-                "pr_url": review["pr_url"],
-                "state": review["state"],
-                "submitted_at": submitted_at,
-                "body": review.get("body", "")[:200],
-            }
-            self.stats["pull_requests_reviewed"].append(review_data)
+            # Already in report shape (see fetch_user_reviews)
+            reviewed.append(review)
         
         # Count review statistics
-        self.stats["total_reviews_given"] = len(self.stats["pull_requests_reviewed"])
-        self.stats["unique_prs_reviewed"] = len(set(r["pr_number"] for r in self.stats["pull_requests_reviewed"]))
+        stats.total_reviews_given = len(reviewed)
+        stats.unique_prs_reviewed = len(set(map(itemgetter("pr_number"), reviewed)))
         
-        # Fetch issues opened
-        issues = self.fetch_user_issues(since_date, self.end_date)
+        # Issues opened
+        issues = activity["issues"]
+        opened = stats.issues_opened
         for issue in issues:
             issue_data = {
                 "number": issue["number"],
@@ -581,10 +1641,11 @@ class GitHubRepoUserAnalyzer:
                 "closed_at": issue.get("closed_at"),
                 "comments_count": issue.get("comments", 0),
             }
-            self.stats["issues_opened"].append(issue_data)
+            opened.append(issue_data)
         
-        # Fetch issues closed
-        closed_issues = self.fetch_user_closed_issues(since_date, self.end_date)
+        # Issues closed
+        closed_issues = activity["closed_issues"]
+        closed = stats.issues_closed
         for issue in closed_issues:
             issue_data = {
                 "number": issue["number"],
@@ -595,26 +1656,21 @@ class GitHubRepoUserAnalyzer:
                 "closed_at": issue.get("closed_at"),
                 "comments_count": issue.get("comments", 0),
             }
-            self.stats["issues_closed"].append(issue_data)
+            closed.append(issue_data)
         
-        # Fetch issue comments
-        issue_comments = self.fetch_user_issue_comments(since_date)
+        # Issue comments
+        issue_comments = activity["issue_comments"]
+        commented = stats.issue_comments
         for comment in issue_comments:
             created_at = comment.get("created_at")
             if created_at:
                 cday = self._merged_at_calendar_day_utc(created_at)
                 if not cday or not (since_s <= cday <= end_s):
                     continue
-
-            comment_data = {
-                "issue_number": comment["issue_number"],
-                "issue_title": comment["issue_title"],
-                "issue_url": comment["issue_url"],
-                "issue_state": comment["issue_state"],
-                "created_at": created_at,
-                "body": comment.get("body", "")[:200],
-            }
-            self.stats["issue_comments"].append(comment_data)
+            # Already in report shape (see fetch_user_issue_comments)
+            commented.append(comment)
+        
+        stats.unique_issues_commented = len(set(map(itemgetter("issue_number"), commented)))
 
     def has_measurable_activity(self, pages_migrated: int = 0) -> bool:
         """True if the HTML report would show any non-zero collaboration or pages migrated."""
@@ -622,11 +1678,11 @@ class GitHubRepoUserAnalyzer:
             return True
         s = self.stats
         return bool(
-            s["pull_requests_merged"]
-            or s["pull_requests_reviewed"]
-            or s["issues_opened"]
-            or s["issues_closed"]
-            or s["issue_comments"]
+            s.pull_requests_merged
+            or s.pull_requests_reviewed
+            or s.issues_opened
+            or s.issues_closed
+            or s.issue_comments
         )
 
     def generate_report(self, days: int, format: str = "text", pages_migrated: int = 0) -> str:
@@ -647,7 +1703,7 @@ class GitHubRepoUserAnalyzer:
         report.append(f"User: @{self.username}")
         
         # Show date range if available
-        if hasattr(self, 'since_date') and hasattr(self, 'end_date'):
+        if self.since_date is not None and self.end_date is not None:
             since_s, end_s = self._report_day_strings(self.since_date, self.end_date)
             report.append(f"Period: {since_s} to {end_s} ({days} days)")
         else:
@@ -660,44 +1716,43 @@ class GitHubRepoUserAnalyzer:
         # Summary Statistics
         report.append("📊 SUMMARY STATISTICS")
         report.append("-" * 80)
-        total_merged = len(self.stats['pull_requests_merged'])
+        total_merged = len(self.stats.pull_requests_merged)
         report.append(f"Pull Requests Merged:     {total_merged}")
-        report.append(f"Reviews Given:            {self.stats.get('total_reviews_given', len(self.stats['pull_requests_reviewed']))}")
-        unique_prs = self.stats.get('unique_prs_reviewed', len(set(r['pr_number'] for r in self.stats['pull_requests_reviewed'])))
+        report.append(f"Reviews Given:            {self.stats.total_reviews_given}")
+        unique_prs = self.stats.unique_prs_reviewed
         report.append(f"Unique PRs Reviewed:      {unique_prs}")
-        report.append(f"Issues Opened:            {len(self.stats['issues_opened'])}")
-        report.append(f"Issues Closed:            {len(self.stats['issues_closed'])}")
-        report.append(f"Issue Comments:           {len(self.stats['issue_comments'])}")
-        unique_issues = len(set(c['issue_number'] for c in self.stats['issue_comments']))
+        report.append(f"Issues Opened:            {len(self.stats.issues_opened)}")
+        report.append(f"Issues Closed:            {len(self.stats.issues_closed)}")
+        report.append(f"Issue Comments:           {len(self.stats.issue_comments)}")
+        unique_issues = self.stats.unique_issues_commented
         report.append(f"Unique Issues Commented:  {unique_issues}")
-        report.append(f"Commits in PRs:           {self.stats.get('total_commits_in_prs', 0)}")
-        report.append(f"Total Lines Added:        +{self.stats['total_additions']}")
-        report.append(f"Total Lines Deleted:      -{self.stats['total_deletions']}")
-        report.append(f"Total Files Changed:      {self.stats['total_files_changed']}")
+        report.append(f"Commits in PRs:           {self.stats.total_commits_in_prs}")
+        report.append(f"Total Lines Added:        +{self.stats.total_additions}")
+        report.append(f"Total Lines Deleted:      -{self.stats.total_deletions}")
+        report.append(f"Total Files Changed:      {self.stats.total_files_changed}")
         report.append("")
         
         # PR Size Distribution
         report.append("📏 PULL REQUEST SIZE DISTRIBUTION")
         report.append("-" * 80)
-        report.append(f"XS  (< 10 changes):       {self.stats['pr_sizes']['xs']}")
-        report.append(f"S   (10-29 changes):      {self.stats['pr_sizes']['s']}")
-        report.append(f"M   (30-99 changes):      {self.stats['pr_sizes']['m']}")
-        report.append(f"L   (100-499 changes):    {self.stats['pr_sizes']['l']}")
-        report.append(f"XL  (500-999 changes):    {self.stats['pr_sizes']['xl']}")
-        report.append(f"XXL (≥ 1000 changes):     {self.stats['pr_sizes']['xxl']}")
+        report.append(f"XS  (< 10 changes):       {self.stats.pr_sizes['xs']}")
+        report.append(f"S   (10-29 changes):      {self.stats.pr_sizes['s']}")
+        report.append(f"M   (30-99 changes):      {self.stats.pr_sizes['m']}")
+        report.append(f"L   (100-499 changes):    {self.stats.pr_sizes['l']}")
+        report.append(f"XL  (500-999 changes):    {self.stats.pr_sizes['xl']}")
+        report.append(f"XXL (≥ 1000 changes):     {self.stats.pr_sizes['xxl']}")
         report.append("")
         
         # Pull Requests Merged (detail)
-        if self.stats["pull_requests_merged"]:
-            report.append(f"✅ PULL REQUESTS MERGED ({len(self.stats['pull_requests_merged'])})")
+        if self.stats.pull_requests_merged:
+            report.append(f"✅ PULL REQUESTS MERGED ({len(self.stats.pull_requests_merged)})")
             report.append("-" * 80)
-            for pr in self.stats["pull_requests_merged"]:
-                size = pr.get("size", "m").upper()
-                report.append(f"  [{size}] #{pr['number']}: {pr['title']}")
+            for pr in self.stats.pull_requests_merged:
+                report.append(f"  [{_PR_SIZE_LABELS[pr['size']]}] #{pr['number']}: {pr['title']}")
                 report.append(f"    URL: {pr['url']}")
                 report.append(
                     f"    Stats: +{pr['additions']} -{pr['deletions']} lines "
-                    f"({pr.get('total_changes', pr['additions'] + pr['deletions'])} total changes), "
+                    f"({pr['total_changes']} total changes), "
                     f"{pr['changed_files']} files, {pr['commits']} commits"
                 )
                 if pr.get("merged_at"):
@@ -705,22 +1760,22 @@ class GitHubRepoUserAnalyzer:
                 report.append("")
         
         # Pull Requests Reviewed
-        if self.stats["pull_requests_reviewed"]:
-            unique_count = len(set(r["pr_number"] for r in self.stats["pull_requests_reviewed"]))
-            report.append(f"👀 PULL REQUESTS REVIEWED ({len(self.stats['pull_requests_reviewed'])} reviews on {unique_count} PRs)")
+        if self.stats.pull_requests_reviewed:
+            unique_count = self.stats.unique_prs_reviewed
+            report.append(f"👀 PULL REQUESTS REVIEWED ({len(self.stats.pull_requests_reviewed)} reviews on {unique_count} PRs)")
             report.append("-" * 80)
             
-            for review in self.stats["pull_requests_reviewed"]:
+            for review in self.stats.pull_requests_reviewed:
                 report.append(f"  • {review['state'].upper()} on #{review['pr_number']}: {review['pr_title']}")
                 report.append(f"    URL: {review['pr_url']}")
                 report.append(f"    Submitted: {review.get('submitted_at') or 'Unknown'}")
                 report.append("")
         
         # Issues Opened
-        if self.stats["issues_opened"]:
-            report.append(f"🐛 ISSUES OPENED ({len(self.stats['issues_opened'])})")
+        if self.stats.issues_opened:
+            report.append(f"🐛 ISSUES OPENED ({len(self.stats.issues_opened)})")
             report.append("-" * 80)
-            for issue in self.stats["issues_opened"]:
+            for issue in self.stats.issues_opened:
                 status = "🔓 Open" if issue["state"] == "open" else "✅ Closed"
                 report.append(f"  {status} #{issue['number']}: {issue['title']}")
                 report.append(f"    URL: {issue['url']}")
@@ -731,10 +1786,10 @@ class GitHubRepoUserAnalyzer:
                 report.append("")
         
         # Issues Closed
-        if self.stats["issues_closed"]:
-            report.append(f"✅ ISSUES CLOSED BY USER ({len(self.stats['issues_closed'])})")
+        if self.stats.issues_closed:
+            report.append(f"✅ ISSUES CLOSED BY USER ({len(self.stats.issues_closed)})")
             report.append("-" * 80)
-            for issue in self.stats["issues_closed"]:
+            for issue in self.stats.issues_closed:
                 report.append(f"  ✅ #{issue['number']}: {issue['title']}")
                 report.append(f"    URL: {issue['url']}")
                 if issue.get("closed_at"):
@@ -743,12 +1798,12 @@ class GitHubRepoUserAnalyzer:
                 report.append("")
         
         # Issue Comments
-        if self.stats["issue_comments"]:
-            unique_issues_count = len(set(c["issue_number"] for c in self.stats["issue_comments"]))
-            report.append(f"💬 ISSUE COMMENTS ({len(self.stats['issue_comments'])} comments on {unique_issues_count} issues)")
+        if self.stats.issue_comments:
+            unique_issues_count = self.stats.unique_issues_commented
+            report.append(f"💬 ISSUE COMMENTS ({len(self.stats.issue_comments)} comments on {unique_issues_count} issues)")
             report.append("-" * 80)
             
-            for comment in self.stats["issue_comments"]:
+            for comment in self.stats.issue_comments:
                 status = "🔓 Open" if comment["issue_state"] == "open" else "✅ Closed"
                 report.append(f"  • {status} #{comment['issue_number']}: {comment['issue_title']}")
                 report.append(f"    URL: {comment['issue_url']}")
@@ -760,339 +1815,47 @@ class GitHubRepoUserAnalyzer:
     
     def _generate_html_report(self, days: int, pages_migrated: int = 0) -> str:
         """Generate HTML report with modern styling"""
-        total_merged = len(self.stats['pull_requests_merged'])
-        total_reviews = self.stats.get('total_reviews_given', len(self.stats['pull_requests_reviewed']))
-        unique_prs_reviewed = self.stats.get('unique_prs_reviewed', len(set(r['pr_number'] for r in self.stats['pull_requests_reviewed'])))
-        total_issues_opened = len(self.stats['issues_opened'])
-        total_issues_closed = len(self.stats['issues_closed'])
-        total_issue_comments = len(self.stats['issue_comments'])
-        unique_issues_commented = len(set(c['issue_number'] for c in self.stats['issue_comments']))
-        
-        html = f"""<!DOCTYPE html>
+        return "".join(self.iter_html_report(days, pages_migrated=pages_migrated))
+
+    def iter_html_report(self, days: int, pages_migrated: int = 0) -> Iterator[str]:
+        """Yield the HTML report in chunks (page head, metrics, one chunk per section, tail)"""
+        stats = self.stats
+        sizes = stats.pr_sizes
+        total_merged = len(stats.pull_requests_merged)
+        total_reviews = stats.total_reviews_given
+        unique_prs_reviewed = stats.unique_prs_reviewed
+        total_issues_opened = len(stats.issues_opened)
+        total_issues_closed = len(stats.issues_closed)
+        total_issue_comments = len(stats.issue_comments)
+        unique_issues_commented = stats.unique_issues_commented
+        # Logins and repo names are plain ASCII today, but everything user-supplied is escaped
+        username = self.username.translate(_HTML_ESCAPE)
+        repo_name = f"{self.owner}/{self.repo}".translate(_HTML_ESCAPE)
+        
+        yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Repository Activity Report - @{self.username}</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            line-height: 1.6;
-            color: oklch(from #24292f l c h);
-            background: linear-gradient(135deg, oklch(from #f6f8fa l c h) 0%, oklch(from #ffffff l c h) 100%);
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 12px;
-            box-shadow: 0 4px 6px oklch(from #000000 l c h / 0.1);
-            overflow: hidden;
-        }}
-        
-        .header {{
-            background: linear-gradient(135deg, oklch(from #0366d6 l c h) 0%, oklch(from #0969da l c h) 100%);
-            color: white;
-            padding: 40px;
-            text-align: center;
-        }}
-        
-        .header h1 {{
-            font-size: 2.5em;
-            margin-bottom: 10px;
-            font-weight: 700;
-        }}
-        
-        .header .repo {{
-            font-size: 1.5em;
-            margin-bottom: 10px;
-            opacity: 0.95;
-            font-family: 'Monaco', monospace;
-        }}
-        
-        .header .username {{
-            font-size: 1.3em;
-            margin-bottom: 15px;
-            opacity: 0.9;
-        }}
-        
-        .header .meta {{
-            font-size: 0.95em;
-            opacity: 0.85;
-        }}
-        
-        .metrics-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            padding: 40px;
-            background: oklch(from #f8f9fa l c h);
-        }}
-        
-        .metric-card {{
-            background: white;
-            padding: 25px;
-            border-radius: 10px;
-            text-align: center;
-            border: 2px solid oklch(from #e9ecef l c h);
-            transition: all 0.3s ease;
-        }}
-        
-        .metric-card:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 8px 15px oklch(from #000000 l c h / 0.1);
-            border-color: oklch(from #0366d6 l c h);
-        }}
-        
-        .metric-value {{
-            font-size: 3em;
-            font-weight: 700;
-            margin: 10px 0;
-            background: linear-gradient(135deg, oklch(from #0366d6 l c h), oklch(from #0969da l c h));
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }}
-        
-        .metric-label {{
-            color: oklch(from #6c757d l c h);
-            font-size: 0.95em;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            font-weight: 600;
-        }}
-        
-        .section {{
-            padding: 40px;
-        }}
-        
-        .section-title {{
-            font-size: 1.8em;
-            margin-bottom: 25px;
-            color: oklch(from #1f2937 l c h);
-            border-bottom: 3px solid oklch(from #0366d6 l c h);
-            padding-bottom: 10px;
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }}
-        
-        .pr-card {{
-            background: white;
-            border: 1px solid oklch(from #e9ecef l c h);
-            border-radius: 8px;
-            padding: 20px;
-            margin-bottom: 20px;
-            transition: all 0.3s ease;
-        }}
-        
-        .pr-card:hover {{
-            box-shadow: 0 4px 12px oklch(from #000000 l c h / 0.1);
-            border-color: oklch(from #0366d6 l c h);
-        }}
-        
-        .pr-title {{
-            font-size: 1.2em;
-            font-weight: 600;
-            color: oklch(from #1f2937 l c h);
-            margin-bottom: 10px;
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }}
-        
-        .pr-number {{
-            color: oklch(from #0366d6 l c h);
-            font-weight: 700;
-        }}
-        
-        .pr-stats {{
-            display: flex;
-            gap: 20px;
-            margin-top: 15px;
-            padding-top: 15px;
-            border-top: 1px solid oklch(from #e9ecef l c h);
-            flex-wrap: wrap;
-        }}
-        
-        .pr-stat {{
-            display: flex;
-            align-items: center;
-            gap: 5px;
-            font-size: 0.9em;
-        }}
-        
-        .stat-additions {{
-            color: oklch(from #22c55e l c h);
-            font-weight: 600;
-        }}
-        
-        .stat-deletions {{
-            color: oklch(from #ef4444 l c h);
-            font-weight: 600;
-        }}
-        
-        .pr-link {{
-            color: oklch(from #0366d6 l c h);
-            text-decoration: none;
-            font-weight: 500;
-        }}
-        
-        .pr-link:hover {{
-            text-decoration: underline;
-        }}
-        
-        .badge {{
-            display: inline-block;
-            padding: 4px 12px;
-            border-radius: 12px;
-            font-size: 0.85em;
-            font-weight: 600;
-            text-transform: uppercase;
-        }}
-        
-        .badge-merged {{
-            background: oklch(from #22c55e l c h / 0.1);
-            color: oklch(from #16a34a l c h);
-        }}
-        
-        .badge-open {{
-            background: oklch(from #3b82f6 l c h / 0.1);
-            color: oklch(from #2563eb l c h);
-        }}
-        
-        .badge-closed {{
-            background: oklch(from #ef4444 l c h / 0.1);
-            color: oklch(from #dc2626 l c h);
-        }}
-        
-        .badge-approved {{
-            background: oklch(from #22c55e l c h / 0.1);
-            color: oklch(from #16a34a l c h);
-        }}
-        
-        .badge-changes-requested {{
-            background: oklch(from #ef4444 l c h / 0.1);
-            color: oklch(from #dc2626 l c h);
-        }}
-        
-        .badge-commented {{
-            background: oklch(from #3b82f6 l c h / 0.1);
-            color: oklch(from #2563eb l c h);
-        }}
-        
-        .badge-size {{
-            font-size: 0.75em;
-            padding: 3px 8px;
-            margin-left: 8px;
-        }}
-        
-        .badge-xs {{
-            background: oklch(from #10b981 l c h / 0.15);
-            color: oklch(from #059669 l c h);
-        }}
-        
-        .badge-s {{
-            background: oklch(from #3b82f6 l c h / 0.15);
-            color: oklch(from #2563eb l c h);
-        }}
-        
-        .badge-m {{
-            background: oklch(from #f59e0b l c h / 0.15);
-            color: oklch(from #d97706 l c h);
-        }}
-        
-        .badge-l {{
-            background: oklch(from #f97316 l c h / 0.15);
-            color: oklch(from #ea580c l c h);
-        }}
-        
-        .badge-xl {{
-            background: oklch(from #ef4444 l c h / 0.15);
-            color: oklch(from #dc2626 l c h);
-        }}
-        
-        .badge-xxl {{
-            background: oklch(from #991b1b l c h / 0.2);
-            color: oklch(from #7f1d1d l c h);
-            font-weight: 700;
-        }}
-        
-        .pr-size-chart {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(140px, 1fr));
-            gap: 15px;
-            margin-top: 20px;
-        }}
-        
-        .size-card {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            text-align: center;
-            border: 2px solid oklch(from #e9ecef l c h);
-        }}
-        
-        .size-label {{
-            font-size: 0.85em;
-            color: oklch(from #6c757d l c h);
-            text-transform: uppercase;
-            font-weight: 600;
-            letter-spacing: 0.5px;
-            margin-bottom: 8px;
-        }}
-        
-        .size-value {{
-            font-size: 2.5em;
-            font-weight: 700;
-            margin: 5px 0;
-        }}
-        
-        .size-description {{
-            font-size: 0.75em;
-            color: oklch(from #6c757d l c h);
-            margin-top: 5px;
-        }}
-        
-        @media (max-width: 768px) {{
-            .metrics-grid {{
-                grid-template-columns: 1fr;
-            }}
-            
-            .header h1 {{
-                font-size: 1.8em;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
+    <title>Repository Activity Report - @{username}</title>
+"""
+        yield _HTML_STYLE
+        yield f"""        <div class="header">
             <h1>📊 Repository Activity Report</h1>
-            <div class="repo">{self.owner}/{self.repo}</div>
-            <div class="username">@{self.username}</div>
+            <div class="repo">{repo_name}</div>
+            <div class="username">@{username}</div>
             <div class="meta">"""
         
         # Show date range if available
-        if hasattr(self, 'since_date') and hasattr(self, 'end_date'):
+        if self.since_date is not None and self.end_date is not None:
             since_s, end_s = self._report_day_strings(self.since_date, self.end_date)
-            since_d = datetime.strptime(since_s, "%Y-%m-%d")
-            end_d = datetime.strptime(end_s, "%Y-%m-%d")
-            html += f"""
-                📅 Period: {since_d.strftime('%B %d, %Y')} to {end_d.strftime('%B %d, %Y')} ({days} days) | """
+            yield f"""
+                📅 Period: {_fmt_day(since_s)} to {_fmt_day(end_s)} ({days} days) | """
         else:
-            html += f"""
+            yield f"""
                 📅 Period: Last {days} days | """
         
-        html += f"""
+        yield f"""
                 🕐 Generated: {datetime.now().strftime('%B %d, %Y at %H:%M:%S')}
             </div>
         </div>
@@ -1104,11 +1867,11 @@ class GitHubRepoUserAnalyzer:
             </div>
             <div class="metric-card" style="background: transparent">
                 <div class="metric-label">📈 Lines Added</div>
-                <div class="metric-value">+{self.stats['total_additions']}</div>
+                <div class="metric-value">+{stats.total_additions}</div>
             </div>
             <div class="metric-card" style="background: transparent">
                 <div class="metric-label">📉 Lines Deleted</div>
-                <div class="metric-value">-{self.stats['total_deletions']}</div>
+                <div class="metric-value">-{stats.total_deletions}</div>
             </div>
             <div class="metric-card" style="background: transparent">
                 <div class="metric-label">📄 Pg Migrated (group)</div>
@@ -1129,42 +1892,42 @@ class GitHubRepoUserAnalyzer:
                     <div class="size-label">
                         <span class="badge badge-xs badge-size">XS</span>
                     </div>
-                    <div class="size-value" style="color: oklch(from #10b981 l c h);">{self.stats['pr_sizes']['xs']}</div>
+                    <div class="size-value" style="color: #10b981;">{sizes['xs']}</div>
                     <div class="size-description">&lt; 10 changes</div>
                 </div>
                 <div class="size-card">
                     <div class="size-label">
                         <span class="badge badge-s badge-size">S</span>
                     </div>
-                    <div class="size-value" style="color: oklch(from #3b82f6 l c h);">{self.stats['pr_sizes']['s']}</div>
+                    <div class="size-value" style="color: #3b82f6;">{sizes['s']}</div>
                     <div class="size-description">10-29 changes</div>
                 </div>
                 <div class="size-card">
                     <div class="size-label">
                         <span class="badge badge-m badge-size">M</span>
                     </div>
-                    <div class="size-value" style="color: oklch(from #f59e0b l c h);">{self.stats['pr_sizes']['m']}</div>
+                    <div class="size-value" style="color: #f59e0b;">{sizes['m']}</div>
                     <div class="size-description">30-99 changes</div>
                 </div>
                 <div class="size-card">
                     <div class="size-label">
                         <span class="badge badge-l badge-size">L</span>
                     </div>
-                    <div class="size-value" style="color: oklch(from #f97316 l c h);">{self.stats['pr_sizes']['l']}</div>
+                    <div class="size-value" style="color: #f97316;">{sizes['l']}</div>
                     <div class="size-description">100-499 changes</div>
                 </div>
                 <div class="size-card">
                     <div class="size-label">
                         <span class="badge badge-xl badge-size">XL</span>
                     </div>
-                    <div class="size-value" style="color: oklch(from #ef4444 l c h);">{self.stats['pr_sizes']['xl']}</div>
+                    <div class="size-value" style="color: #ef4444;">{sizes['xl']}</div>
                     <div class="size-description">500-999 changes</div>
                 </div>
                 <div class="size-card">
                     <div class="size-label">
                         <span class="badge badge-xxl badge-size">XXL</span>
                     </div>
-                    <div class="size-value" style="color: oklch(from #991b1b l c h);">{self.stats['pr_sizes']['xxl']}</div>
+                    <div class="size-value" style="color: #991b1b;">{sizes['xxl']}</div>
                     <div class="size-description">≥ 1000 changes</div>
                 </div>
             </div>
@@ -1202,192 +1965,90 @@ class GitHubRepoUserAnalyzer:
 """
         
         # Pull Requests Merged Section
-        if self.stats["pull_requests_merged"]:
-            html += f"""
+        if stats.pull_requests_merged:
+            yield f"""
         <div class="section">
             <h2 class="section-title">
                 <span>✅</span>
-                Pull Requests Merged ({len(self.stats['pull_requests_merged'])})
+                Pull Requests Merged ({total_merged})
             </h2>
 """
-            for pr in self.stats["pull_requests_merged"]:
-                pr_size = pr.get("size", "m").upper()
-                size_badge_class = f"badge-{pr.get('size', 'm')}"
-                size_badge = f'<span class="badge {size_badge_class} badge-size">{pr_size}</span>'
-                merged_raw = pr.get("merged_at") or ""
-                if merged_raw:
-                    try:
-                        mt = merged_raw.replace("Z", "+00:00") if merged_raw.endswith("Z") else merged_raw
-                        merge_label = datetime.fromisoformat(mt).strftime("%B %d, %Y")
-                    except ValueError:
-                        merge_label = merged_raw[:10]
-                else:
-                    merge_label = "—"
-
-                html += f"""
-            <div class="pr-card">
-                <div class="pr-title">
-                    <span class="pr-number">#{pr['number']}</span>
-                    <a href="{pr['url']}" class="pr-link" target="_blank">{pr['title']}</a>
-                    <span class="badge badge-merged">✅ Merged</span>
-                    {size_badge}
-                </div>
-                <div class="pr-stats">
-                    <div class="pr-stat">📅 Merged {merge_label}</div>
-                    <div class="pr-stat">
-                        <span class="stat-additions">+{pr['additions']}</span>
-                    </div>
-                    <div class="pr-stat">
-                        <span class="stat-deletions">-{pr['deletions']}</span>
-                    </div>
-                    <div class="pr-stat">📊 {pr.get('total_changes', pr['additions'] + pr['deletions'])} total changes</div>
-                    <div class="pr-stat">📄 {pr['changed_files']} files</div>
-                    <div class="pr-stat">💾 {pr['commits']} commits</div>
-                </div>
-            </div>
-"""
-            html += "        </div>\n"
+            yield "".join(
+                _render_pr_card(
+                    pr['number'],
+                    pr['url'],
+                    pr['title'],
+                    pr['size'],
+                    pr.get("merged_at") or "",
+                    pr['additions'],
+                    pr['deletions'],
+                    pr['total_changes'],
+                    pr['changed_files'],
+                    pr['commits'],
+                )
+                for pr in stats.pull_requests_merged
+            )
+            yield "        </div>\n"
         
         # Issues Closed Section
-        if self.stats["issues_closed"]:
-            html += f"""
+        if stats.issues_closed:
+            yield f"""
         <div class="section">
             <h2 class="section-title">
                 <span>✅</span>
-                Issues Closed by {self.username} ({len(self.stats['issues_closed'])})
+                Issues Closed by {username} ({total_issues_closed})
             </h2>
 """
-            for issue in self.stats["issues_closed"]:
-                closed_date = datetime.strptime(issue['closed_at'], "%Y-%m-%dT%H:%M:%SZ").strftime('%B %d, %Y') if issue.get('closed_at') else 'Unknown'
-                
-                html += f"""
-            <div class="pr-card">
-                <div class="pr-title">
-                    <span class="pr-number">#{issue['number']}</span>
-                    <a href="{issue['url']}" class="pr-link" target="_blank">{issue['title']}</a>
-                    <span class="badge badge-closed">✅ Closed</span>
-                </div>
-                <div class="pr-stats">
-                    <div class="pr-stat">🔒 Closed: {closed_date}</div>
-                    <div class="pr-stat">💬 {issue['comments_count']} comments</div>
-                </div>
-            </div>
-"""
-            html += "        </div>\n"
+            yield "".join(map(_CLOSED_ISSUE_CARD_TMPL.format_map, _closed_issue_card_fields(stats.issues_closed)))
+            yield "        </div>\n"
         
         # Reviews Section
-        if self.stats["pull_requests_reviewed"]:
-            html += f"""
+        if stats.pull_requests_reviewed:
+            yield f"""
         <div class="section">
             <h2 class="section-title">
                 <span>👀</span>
-                Pull Requests Reviewed ({len(self.stats["pull_requests_reviewed"])} reviews on {unique_prs_reviewed} PRs)
+                Pull Requests Reviewed ({total_reviews} reviews on {unique_prs_reviewed} PRs)
             </h2>
             <p style="color: #6c757d; margin-bottom: 20px; font-size: 0.95em;">
                 <em>Showing all reviews. You may have reviewed some PRs multiple times.</em>
             </p>
 """
-            for review in self.stats["pull_requests_reviewed"]:
-                review_state = review['state'].upper()
-                badge_class = {
-                    'APPROVED': 'badge-approved',
-                    'CHANGES_REQUESTED': 'badge-changes-requested',
-                    'COMMENTED': 'badge-commented'
-                }.get(review_state, 'badge-commented')
-                
-                submitted_at = review.get('submitted_at')
-                if submitted_at:
-                    review_date = datetime.strptime(submitted_at, "%Y-%m-%dT%H:%M:%SZ").strftime('%B %d, %Y')
-                else:
-                    review_date = "Unknown"
-                
-                html += f"""
-            <div class="pr-card">
-                <div class="pr-title">
-                    <span class="pr-number">#{review['pr_number']}</span>
-                    <a href="{review['pr_url']}" class="pr-link" target="_blank">{review['pr_title']}</a>
-                    <span class="badge {badge_class}">{review_state}</span>
-                </div>
-                <div class="pr-stats">
-                    <div class="pr-stat">📅 {review_date}</div>
-                </div>
-            </div>
-"""
-            html += "        </div>\n"
+            yield "".join(map(_REVIEW_CARD_TMPL.format_map, _review_card_fields(stats.pull_requests_reviewed)))
+            yield "        </div>\n"
         
         # Issues Section
-        if self.stats["issues_opened"]:
-            html += f"""
+        if stats.issues_opened:
+            yield f"""
         <div class="section">
             <h2 class="section-title">
                 <span>🐛</span>
-                Issues Opened ({len(self.stats["issues_opened"])})
+                Issues Opened ({total_issues_opened})
             </h2>
 """
-            for issue in self.stats["issues_opened"]:
-                status_badge = '<span class="badge badge-open">🔓 Open</span>' if issue["state"] == "open" else '<span class="badge badge-closed">✅ Closed</span>'
-                issue_date = datetime.strptime(issue['created_at'], "%Y-%m-%dT%H:%M:%SZ").strftime('%B %d, %Y')
-                
-                html += f"""
-            <div class="pr-card">
-                <div class="pr-title">
-                    <span class="pr-number">#{issue['number']}</span>
-                    <a href="{issue['url']}" class="pr-link" target="_blank">{issue['title']}</a>
-                    {status_badge}
-                </div>
-                <div class="pr-stats">
-                    <div class="pr-stat">📅 {issue_date}</div>
-                    <div class="pr-stat">💬 {issue['comments_count']} comments</div>
-                </div>
-            </div>
-"""
-            html += "        </div>\n"
+            yield "".join(map(_ISSUE_CARD_TMPL.format_map, _issue_card_fields(stats.issues_opened)))
+            yield "        </div>\n"
         
         # Issue Comments Section
-        if self.stats["issue_comments"]:
-            unique_issues = len(set(c['issue_number'] for c in self.stats['issue_comments']))
-            html += f"""
+        if stats.issue_comments:
+            yield f"""
         <div class="section">
             <h2 class="section-title">
                 <span>💬</span>
-                Issue Comments ({len(self.stats["issue_comments"])} comments on {unique_issues} issues)
+                Issue Comments ({total_issue_comments} comments on {unique_issues_commented} issues)
             </h2>
             <p style="color: #6c757d; margin-bottom: 20px; font-size: 0.95em;">
                 <em>Showing all comments. You may have commented on some issues multiple times.</em>
             </p>
 """
-            for comment in self.stats["issue_comments"]:
-                status_badge = '<span class="badge badge-open">🔓 Open</span>' if comment["issue_state"] == "open" else '<span class="badge badge-closed">✅ Closed</span>'
-                comment_date = datetime.strptime(comment['created_at'], "%Y-%m-%dT%H:%M:%SZ").strftime('%B %d, %Y')
-                comment_preview = comment['body'][:100] + '...' if len(comment['body']) > 100 else comment['body']
-                
-                html += f"""
-            <div class="pr-card">
-                <div class="pr-title">
-                    <span class="pr-number">#{comment['issue_number']}</span>
-                    <a href="{comment['issue_url']}" class="pr-link" target="_blank">{comment['issue_title']}</a>
-                    {status_badge}
-                </div>
-                <div class="pr-stats">
-                    <div class="pr-stat">📅 {comment_date}</div>
-                </div>
-                <div style="margin-top: 10px; padding: 10px; background: oklch(from #f8f9fa l c h); border-radius: 4px; font-size: 0.9em; color: oklch(from #495057 l c h);">
-                    {comment_preview}
-                </div>
-            </div>
-"""
-            html += "        </div>\n"
+            yield "".join(map(_COMMENT_CARD_TMPL.format_map, _comment_card_fields(stats.issue_comments)))
+            yield "        </div>\n"
         
-        html += """
-    </div>
-</body>
-</html>
-"""
-        return html
+        yield _HTML_TAIL
     
     def _generate_json_report(self) -> str:
         """Generate JSON report"""
-        return json.dumps(self.stats, indent=2, default=str)
+        return _dump_dataclass(self.stats)
 
 
 def main():
@@ -1445,10 +2106,16 @@ Examples:
         help="If the window has no merged PRs, reviews, or issue activity (and --pages-migrated is 0), "
         "skip writing --output and exit with code 2 (used by generate_user_activity_reports.py).",
     )
+    parser.add_argument(
+        "--http-cache",
+        action="store_true",
+        help="Cache GitHub API GET responses next to this script: .gh_report_cache.sqlite for an hour "
+        "with requests-cache installed, otherwise ETag revalidation via .gh_etag_cache.json. "
+        "Useful when re-running the same repo with different formats.",
+    )
 
     args = parser.parse_args()
     
-    import os
     # API URL: --api-url wins, then env GITHUB_API_URL, else default (github.com)
     api_url = args.api_url or os.environ.get("GITHUB_API_URL")
     # Token: --token wins; if using Enterprise API URL, try GITHUB_ENTERPRISE_TOKEN then GITHUB_TOKEN; else GITHUB_TOKEN only
@@ -1490,10 +2157,15 @@ Examples:
         )
 
     # Create analyzer
-    analyzer = GitHubRepoUserAnalyzer(args.owner, args.repo, args.username, token, base_url=api_url)
+    analyzer = GitHubRepoUserAnalyzer(
+        args.owner, args.repo, args.username, token, base_url=api_url, http_cache=args.http_cache
+    )
 
     # Analyze activity
-    analyzer.analyze_activity(report_days, end_date, since_date)
+    try:
+        analyzer.analyze_activity(report_days, end_date, since_date)
+    finally:
+        analyzer.close()
 
     if args.omit_if_empty and not analyzer.has_measurable_activity(args.pages_migrated):
         print(
@@ -1503,6 +2175,15 @@ Examples:
         )
         sys.exit(2)
 
+    # HTML is streamed to the file section by section rather than joined in memory first
+    if args.output and args.format == "html":
+        with open(args.output, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.writelines(
+                analyzer.iter_html_report(report_days, pages_migrated=args.pages_migrated)
+            )
+        print(f"\nReport saved to: {args.output}")
+        return
+
     # Generate report
     report = analyzer.generate_report(
         days=report_days, format=args.format, pages_migrated=args.pages_migrated
@@ -1510,7 +2191,7 @@ Examples:
 
     # Output report
     if args.output:
-        with open(args.output, "w") as f:
+        with open(args.output, "w", encoding="utf-8") as f:
             f.write(report)
         print(f"\nReport saved to: {args.output}")
     else:
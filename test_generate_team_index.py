@@ -0,0 +1,130 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from generate_team_index import (
+    ReportMetricsParser,
+    _StopParsing,
+    _report_dates,
+    _scrape_report_fields,
+    _split_cached,
+)
+from github_repo_user_report import GitHubRepoUserAnalyzer
+
+
+def _sample_report() -> bytes:
+    analyzer = GitHubRepoUserAnalyzer("example", "repo", "helms-charity")
+    analyzer.stats.total_additions = 120
+    analyzer.stats.total_deletions = 45
+    analyzer.stats.total_reviews_given = 3
+    analyzer.stats.issue_comments = [
+        {
+            "issue_number": 9,
+            "issue_title": "Tabs <b> & spaces",
+            "issue_url": "https://github.com/example/repo/issues/9",
+            "issue_state": "open",
+            "created_at": "2026-05-04T12:00:00Z",
+            "body": "first line\nsecond line",
+        }
+    ]
+    return analyzer.generate_report(7, "html", pages_migrated=4).encode("utf-8")
+
+
+class ReportFieldExtractionTests(unittest.TestCase):
+    def test_regex_scan_matches_html_parser(self):
+        content = _sample_report()
+
+        parser = ReportMetricsParser()
+        try:
+            parser.feed(content.decode("utf-8"))
+        except _StopParsing:
+            pass
+        repo, username, metrics = _scrape_report_fields(content)
+
+        self.assertEqual(repo, "example/repo")
+        self.assertEqual(repo, f"{parser.repo_owner}/{parser.repo_name}")
+        self.assertEqual(username, parser.username)
+        self.assertEqual(username, "helms-charity")
+        self.assertEqual(metrics, parser.metrics)
+        self.assertEqual(len(metrics), 8)
+
+
+class ReportDateTests(unittest.TestCase):
+    def test_undated_stems_fall_back_to_their_own_mtime(self):
+        stems = [
+            "alice-repo-2026-05-31",
+            "bob-repo",
+            "carol-repo-2026-06-07",
+            "dave-notes",
+        ]
+        mtimes = [0.0, 1780000000.0, 0.0, 1790000000.0]
+
+        dates = _report_dates(stems, mtimes)
+
+        self.assertEqual(dates, [
+            "2026-05-31",
+            datetime.fromtimestamp(mtimes[1]).strftime("%Y-%m-%d"),
+            "2026-06-07",
+            datetime.fromtimestamp(mtimes[3]).strftime("%Y-%m-%d"),
+        ])
+
+
+class ParseCacheTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.path = self.dir / "alice-repo-2026-05-31.html"
+        self.path.write_text("<div class=\"repo\">a/b</div>", encoding="utf-8")
+
+    def _cache_for(self, path):
+        new_cache, paths, _, _, _ = _split_cached([path], {})
+        self.assertEqual(paths, [path])
+        new_cache[path.name]["data"] = {"repo": "a/b"}
+        return new_cache
+
+    def test_unchanged_file_is_served_from_cache(self):
+        cache = self._cache_for(self.path)
+
+        new_cache, paths, names, stems, mtimes = _split_cached([self.path], cache)
+
+        self.assertEqual(paths, [])
+        self.assertEqual(new_cache[self.path.name]["data"], {"repo": "a/b"})
+
+    def test_failed_parse_is_not_reused(self):
+        new_cache, _, _, _, _ = _split_cached([self.path], {})
+        new_cache[self.path.name]["data"] = None
+
+        new_cache, paths, _, _, _ = _split_cached([self.path], new_cache)
+
+        self.assertEqual(paths, [self.path])
+        self.assertNotIn("data", new_cache[self.path.name])
+
+    def test_changed_mtime_invalidates_entry(self):
+        cache = self._cache_for(self.path)
+        st = self.path.stat()
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        new_cache, paths, names, stems, _ = _split_cached([self.path], cache)
+
+        self.assertEqual(paths, [self.path])
+        self.assertEqual(names, [self.path.name])
+        self.assertEqual(stems, [self.path.stem])
+        self.assertNotIn("data", new_cache[self.path.name])
+
+    def test_changed_size_invalidates_entry(self):
+        cache = self._cache_for(self.path)
+        st = self.path.stat()
+        self.path.write_text("<div class=\"repo\">a/bc</div>", encoding="utf-8")
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        new_cache, paths, _, _, _ = _split_cached([self.path], cache)
+
+        self.assertEqual(paths, [self.path])
+        self.assertNotIn("data", new_cache[self.path.name])
+
+
+if __name__ == "__main__":
+    unittest.main()
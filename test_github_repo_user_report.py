@@ -1,8 +1,26 @@
+import html
+import importlib.util
+import json
+import os
+import re
+import sys
+import time
+import tempfile
 import unittest
 from datetime import datetime, timezone
 from unittest.mock import patch
 
-from github_repo_user_report import GitHubRepoUserAnalyzer
+import requests
+from requests.adapters import HTTPAdapter
+
+import github_repo_user_report
+from github_repo_user_report import (
+    GitHubRepoUserAnalyzer,
+    _ETagCacheAdapter,
+    _first_line,
+    _fmt_date,
+    _fmt_day,
+)
 
 
 class MockResponse:
@@ -10,6 +28,8 @@ class MockResponse:
         self.status_code = status_code
         self._payload = payload
         self.text = str(payload)
+        self.content = json.dumps(payload).encode("utf-8")
+        self.headers = {}
 
     def json(self):
         return self._payload
@@ -60,7 +80,7 @@ class GitHubRepoUserAnalyzerIssueTests(unittest.TestCase):
             calls.append((url, params))
             return MockResponse(200, payload)
 
-        with patch("github_repo_user_report.requests.get", side_effect=fake_get):
+        with patch.object(analyzer._session, "get", side_effect=fake_get):
             issues = analyzer.fetch_user_issues(
                 datetime(2026, 5, 1, tzinfo=timezone.utc),
                 datetime(2026, 5, 8, tzinfo=timezone.utc),
@@ -73,5 +93,558 @@ class GitHubRepoUserAnalyzerIssueTests(unittest.TestCase):
         self.assertEqual(calls[0][1]["sort"], "created")
 
 
+class GitHubRepoUserAnalyzerPullRequestTests(unittest.TestCase):
+    def test_fetch_user_prs_uses_graphql_search_when_token_is_set(self):
+        analyzer = GitHubRepoUserAnalyzer("example", "repo", "helms-charity", "token")
+        posts = []
+
+        def node(number, login, merged_at):
+            return {
+                "number": number,
+                "title": f"PR {number}",
+                "url": f"https://github.com/example/repo/pull/{number}",
+                "state": "MERGED",
+                "createdAt": "2026-05-02T12:00:00Z",
+                "updatedAt": merged_at,
+                "mergedAt": merged_at,
+                "closedAt": merged_at,
+                "additions": 12,
+                "deletions": 3,
+                "changedFiles": 2,
+                "commits": {"totalCount": 4},
+                "author": {"login": login},
+            }
+
+        payload = {
+            "data": {
+                "search": {
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    "nodes": [
+                        node(1, "helms-charity", "2026-05-04T13:00:00Z"),
+                        node(2, "someone-else", "2026-05-04T13:00:00Z"),
+                        {},
+                    ],
+                }
+            }
+        }
+
+        def fake_post(url, headers=None, json=None, timeout=None):
+            posts.append((url, json))
+            return MockResponse(200, payload)
+
+        with patch.object(analyzer._session, "post", side_effect=fake_post), \
+                patch.object(analyzer._session, "get") as fake_get:
+            prs = analyzer.fetch_user_prs(
+                datetime(2026, 5, 1, tzinfo=timezone.utc),
+                datetime(2026, 5, 8, tzinfo=timezone.utc),
+            )
+
+        fake_get.assert_not_called()
+        self.assertEqual(posts[0][0], "https://api.github.com/graphql")
+        self.assertIn("merged:2026-05-01..2026-05-07", posts[0][1]["variables"]["q"])
+        self.assertEqual([pr["number"] for pr in prs], [1])
+        self.assertEqual(prs[0]["state"], "closed")
+        self.assertEqual(prs[0]["commits"], 4)
+        self.assertEqual(prs[0]["changed_files"], 2)
+
+
+class GitHubRepoUserAnalyzerReviewTests(unittest.TestCase):
+    # 25 PRs -> two aliased GraphQL batches (20 + 5)
+    PR_NUMBERS = list(range(1, 26))
+
+    @staticmethod
+    def _reviews(number):
+        return [
+            ("helms-charity", "APPROVED", "2026-05-04T12:00:00Z", f"looks good {number}"),
+            ("someone-else", "COMMENTED", "2026-05-04T13:00:00Z", None),
+        ]
+
+    def _fetch(self, token):
+        analyzer = GitHubRepoUserAnalyzer("example", "repo", "helms-charity", token)
+        batches = []
+
+        def fake_get(url, headers=None, params=None):
+            if url.endswith("/search/issues"):
+                items = [
+                    {
+                        "number": n,
+                        "title": f"PR {n}",
+                        "html_url": f"https://github.com/example/repo/pull/{n}",
+                    }
+                    for n in self.PR_NUMBERS
+                ]
+                return MockResponse(200, {"total_count": len(items), "items": items})
+            number = int(url.rsplit("/", 2)[-2])
+            return MockResponse(200, [
+                {"user": {"login": login}, "state": state, "submitted_at": at, "body": body}
+                for login, state, at, body in self._reviews(number)
+            ])
+
+        def fake_post(url, headers=None, json=None, timeout=None):
+            aliases = re.findall(r"(pr\d+): pullRequest\(number: (\d+)\)", json["query"])
+            batches.append(len(aliases))
+            repository = {
+                alias: {
+                    "number": int(number),
+                    "reviews": {"nodes": [
+                        {"author": {"login": login}, "state": state, "submittedAt": at, "body": body}
+                        for login, state, at, body in self._reviews(int(number))
+                    ] + [None]},
+                }
+                for alias, number in aliases
+            }
+            return MockResponse(200, {"data": {"repository": repository}})
+
+        with patch.object(analyzer._session, "get", side_effect=fake_get), \
+                patch.object(analyzer._session, "post", side_effect=fake_post):
+            reviews = analyzer.fetch_user_reviews(datetime(2026, 5, 1, tzinfo=timezone.utc))
+        return reviews, batches
+
+    def test_graphql_batches_match_rest_reviews(self):
+        graphql_reviews, batches = self._fetch("token")
+        rest_reviews, rest_batches = self._fetch(None)
+
+        self.assertEqual(batches, [20, 5])
+        self.assertEqual(rest_batches, [])
+        self.assertEqual(graphql_reviews, rest_reviews)
+        self.assertEqual([r["pr_number"] for r in graphql_reviews], self.PR_NUMBERS)
+        self.assertEqual(graphql_reviews[0]["state"], "APPROVED")
+        self.assertEqual(graphql_reviews[0]["body"], "looks good 1")
+
+
+def _search_payload(nodes):
+    return {"data": {"search": {"pageInfo": {"hasNextPage": False, "endCursor": None}, "nodes": nodes}}}
+
+
+class GitHubRepoUserAnalyzerClosedIssueTests(unittest.TestCase):
+    def test_graphql_close_events_decide_who_closed_the_issue(self):
+        analyzer = GitHubRepoUserAnalyzer("example", "repo", "helms-charity", "token")
+
+        def issue(number, closes):
+            return {
+                "number": number,
+                "title": f"Issue {number}",
+                "url": f"https://github.com/example/repo/issues/{number}",
+                "state": "CLOSED",
+                "createdAt": "2026-04-20T09:00:00Z",
+                "closedAt": closes[-1][1],
+                "comments": {"totalCount": 2},
+                "timelineItems": {"nodes": [
+                    {"actor": {"login": login}, "createdAt": at} for login, at in closes
+                ] + [None]},
+            }
+
+        nodes = [
+            # closed in the window by the user (after an earlier close by someone else)
+            issue(1, [("someone-else", "2026-04-25T10:00:00Z"), ("Helms-Charity", "2026-05-05T10:00:00Z")]),
+            # closed in the window, but by someone else
+            issue(2, [("someone-else", "2026-05-05T10:00:00Z")]),
+            # closed by the user, but only before the window
+            issue(3, [("helms-charity", "2026-04-30T23:59:59Z")]),
+        ]
+        posts = []
+
+        def fake_post(url, headers=None, json=None, timeout=None):
+            posts.append(json["variables"]["q"])
+            return MockResponse(200, _search_payload(nodes))
+
+        with patch.object(analyzer._session, "post", side_effect=fake_post), \
+                patch.object(analyzer._session, "get") as fake_get:
+            closed = analyzer.fetch_user_closed_issues(
+                datetime(2026, 5, 1, tzinfo=timezone.utc),
+                datetime(2026, 5, 8, tzinfo=timezone.utc),
+            )
+
+        fake_get.assert_not_called()
+        self.assertIn("closed:2026-05-01..2026-05-07", posts[0])
+        self.assertEqual(closed, [{
+            "number": 1,
+            "title": "Issue 1",
+            "html_url": "https://github.com/example/repo/issues/1",
+            "state": "closed",
+            "created_at": "2026-04-20T09:00:00Z",
+            "closed_at": "2026-05-05T10:00:00Z",
+            "comments": 2,
+        }])
+
+
+class GitHubRepoUserAnalyzerActivityTests(unittest.TestCase):
+    def test_fetch_all_activity_merges_all_fetchers_and_filters_by_user(self):
+        analyzer = GitHubRepoUserAnalyzer("example", "repo", "helms-charity", "token")
+        search_queries = []
+
+        def pr_node(number, login):
+            return {
+                "number": number,
+                "title": f"PR {number}",
+                "url": f"https://github.com/example/repo/pull/{number}",
+                "state": "MERGED",
+                "createdAt": "2026-05-02T12:00:00Z",
+                "updatedAt": "2026-05-04T13:00:00Z",
+                "mergedAt": "2026-05-04T13:00:00Z",
+                "closedAt": "2026-05-04T13:00:00Z",
+                "additions": 1,
+                "deletions": 1,
+                "changedFiles": 1,
+                "commits": {"totalCount": 1},
+                "author": {"login": login},
+            }
+
+        def comment(login, body):
+            return {"author": {"login": login}, "createdAt": "2026-05-04T12:00:00Z", "body": body}
+
+        def fake_post(url, headers=None, json=None, timeout=None):
+            query = json["query"]
+            if "pullRequest(number:" in query:
+                return MockResponse(200, {"data": {"repository": {
+                    "pr0": {"number": 3, "reviews": {"nodes": [
+                        {"author": {"login": "helms-charity"}, "state": "APPROVED",
+                         "submittedAt": "2026-05-04T12:00:00Z", "body": ""},
+                    ]}},
+                }}})
+            search_queries.append(json["variables"]["q"])
+            if "timelineItems" in query:
+                return MockResponse(200, _search_payload([]))
+            if "mergedAt" in query:
+                return MockResponse(200, _search_payload([
+                    pr_node(1, "helms-charity"),
+                    pr_node(2, "someone-else"),
+                ]))
+            if "comments(last: 100)" in query:
+                return MockResponse(200, _search_payload([
+                    {
+                        "number": 8,
+                        "title": "Needs triage",
+                        "url": "https://github.com/example/repo/issues/8",
+                        "state": "OPEN",
+                        "comments": {"nodes": [
+                            comment("helms-charity", "mine"),
+                            None,
+                            comment("someone-else", "theirs"),
+                        ]},
+                    },
+                ]))
+            return MockResponse(200, _search_payload([]))
+
+        def fake_get(url, headers=None, params=None, timeout=None):
+            if url.endswith("/search/issues"):
+                return MockResponse(200, {"total_count": 1, "items": [
+                    {"number": 3, "title": "PR 3", "html_url": "https://github.com/example/repo/pull/3"},
+                ]})
+            return MockResponse(200, [])
+
+        with patch.object(analyzer._session, "post", side_effect=fake_post), \
+                patch.object(analyzer._session, "get", side_effect=fake_get):
+            activity = analyzer.fetch_all_activity(
+                datetime(2026, 5, 1, tzinfo=timezone.utc),
+                datetime(2026, 5, 8, tzinfo=timezone.utc),
+            )
+
+        self.assertEqual(
+            set(activity), {"prs", "reviews", "issues", "closed_issues", "issue_comments"}
+        )
+        self.assertEqual([pr["number"] for pr in activity["prs"]], [1])
+        self.assertEqual(activity["issues"], [])
+        self.assertEqual(activity["closed_issues"], [])
+        self.assertEqual([r["pr_number"] for r in activity["reviews"]], [3])
+        self.assertEqual(activity["issue_comments"], [{
+            "issue_number": 8,
+            "issue_title": "Needs triage",
+            "issue_url": "https://github.com/example/repo/issues/8",
+            "issue_state": "open",
+            "created_at": "2026-05-04T12:00:00Z",
+            "body": "mine",
+        }])
+        commented_q = [q for q in search_queries if "commenter:helms-charity" in q]
+        self.assertEqual(len(commented_q), 1)
+        self.assertTrue(commented_q[0].endswith(" sort:updated-desc"))
+
+
+class GitHubRepoUserAnalyzerSearchPagingTests(unittest.TestCase):
+    def _search(self, total_count, pages=3):
+        analyzer = GitHubRepoUserAnalyzer("example", "repo", "helms-charity")
+        requested = []
+
+        def fake_get(url, headers=None, params=None):
+            page = params["page"]
+            requested.append(page)
+            count = min(100, total_count - (page - 1) * 100)
+            items = [{"number": (page - 1) * 100 + i} for i in range(max(count, 0))]
+            return MockResponse(200, {"total_count": total_count, "items": items})
+
+        with patch.object(analyzer._session, "get", side_effect=fake_get):
+            batches = analyzer._search_issues_pages("repo:example/repo", pages=pages)
+        return batches, sorted(requested)
+
+    def test_short_first_page_makes_a_single_request(self):
+        batches, requested = self._search(42)
+        self.assertEqual(requested, [1])
+        self.assertEqual([len(batch) for batch in batches], [42])
+
+    def test_only_pages_reported_by_total_count_are_fetched(self):
+        batches, requested = self._search(150)
+        self.assertEqual(requested, [1, 2])
+        self.assertEqual([len(batch) for batch in batches], [100, 50])
+
+    def test_page_limit_caps_requests(self):
+        batches, requested = self._search(1000, pages=3)
+        self.assertEqual(requested, [1, 2, 3])
+        self.assertEqual(len(batches), 3)
+
+
+class GitHubRepoUserAnalyzerRateLimitTests(unittest.TestCase):
+    def test_rate_limited_response_is_retried_after_retry_after(self):
+        analyzer = GitHubRepoUserAnalyzer("example", "repo", "helms-charity")
+        limited = MockResponse(403, {"message": "secondary rate limit"})
+        limited.headers = {"Retry-After": "7"}
+        ok = MockResponse(200, {"items": []})
+
+        with patch.object(analyzer._session, "get", side_effect=[limited, ok]) as fake_get, \
+                patch("github_repo_user_report.time.sleep") as fake_sleep:
+            response = analyzer._get("https://api.github.com/search/issues")
+
+        self.assertIs(response, ok)
+        self.assertEqual(fake_get.call_count, 2)
+        fake_sleep.assert_called_once_with(7.0)
+
+    def test_malformed_rate_limit_headers_are_ignored(self):
+        analyzer = GitHubRepoUserAnalyzer("example", "repo", "helms-charity")
+        ok = MockResponse(200, {"items": []})
+        ok.headers = {"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "soon"}
+        limited = MockResponse(403, {"message": "rate limit"})
+        limited.headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "n/a"}
+
+        with patch.object(analyzer._session, "get", side_effect=[ok, limited]), \
+                patch("github_repo_user_report.time.sleep") as fake_sleep:
+            self.assertIs(analyzer._get("https://api.github.com/rate_limit"), ok)
+            self.assertIs(analyzer._get("https://api.github.com/rate_limit"), limited)
+
+        fake_sleep.assert_not_called()
+
+    def test_long_reset_is_reported_once_per_window(self):
+        analyzer = GitHubRepoUserAnalyzer("example", "repo", "helms-charity")
+        reset = str(int(time.time()) + 3600)
+
+        def low():
+            response = MockResponse(200, {"items": []})
+            response.headers = {"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": reset}
+            return response
+
+        with patch.object(analyzer._session, "get", side_effect=[low() for _ in range(5)]), \
+                patch("github_repo_user_report.time.sleep") as fake_sleep, \
+                patch("builtins.print") as fake_print:
+            for _ in range(5):
+                analyzer._get("https://api.github.com/search/issues")
+
+        fake_sleep.assert_not_called()
+        warnings = [c for c in fake_print.call_args_list if "not waiting" in c.args[0]]
+        self.assertEqual(len(warnings), 1)
+
+    def test_forbidden_without_rate_limit_headers_is_returned(self):
+        analyzer = GitHubRepoUserAnalyzer("example", "repo", "helms-charity")
+        forbidden = MockResponse(403, {"message": "Resource not accessible"})
+
+        with patch.object(analyzer._session, "get", return_value=forbidden) as fake_get, \
+                patch("github_repo_user_report.time.sleep") as fake_sleep:
+            response = analyzer._get("https://api.github.com/repos/example/repo/issues")
+
+        self.assertIs(response, forbidden)
+        self.assertEqual(fake_get.call_count, 1)
+        fake_sleep.assert_not_called()
+
+
+class ETagCacheAdapterTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "etags.json")
+
+    @staticmethod
+    def _response(status_code, body=b"", etag=None):
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = body
+        if etag:
+            response.headers["ETag"] = etag
+        return response
+
+    @staticmethod
+    def _get(url):
+        return requests.Request("GET", url).prepare()
+
+    def test_304_is_replayed_as_stored_200_body(self):
+        url = "https://api.github.com/repos/example/repo/issues"
+        adapter = _ETagCacheAdapter(self.path)
+        sent = []
+
+        def fake_send(self_, request, **kwargs):
+            sent.append(dict(request.headers))
+            if len(sent) == 1:
+                return ETagCacheAdapterTests._response(200, b'{"n": 1}', etag='"abc"')
+            return ETagCacheAdapterTests._response(304)
+
+        with patch.object(HTTPAdapter, "send", fake_send):
+            adapter.send(self._get(url))
+            response = adapter.send(self._get(url))
+
+        self.assertNotIn("If-None-Match", sent[0])
+        self.assertEqual(sent[1]["If-None-Match"], '"abc"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"n": 1})
+
+    def test_close_keeps_only_urls_used_in_this_run(self):
+        used = "https://api.github.com/search/issues?q=new"
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({
+                used: {"etag": '"u"', "body": "{}"},
+                "https://api.github.com/search/issues?q=old": {"etag": '"o"', "body": "{}"},
+            }, f)
+        adapter = _ETagCacheAdapter(self.path)
+
+        with patch.object(HTTPAdapter, "send", lambda self_, request, **kwargs: self._response(304)):
+            adapter.send(self._get(used))
+        adapter.close()
+
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(list(json.load(f)), [used])
+
+
+class HtmlReportTests(unittest.TestCase):
+    def _analyzer(self):
+        analyzer = GitHubRepoUserAnalyzer("example", "repo", "helms-charity")
+        analyzer.stats.issues_opened.append({
+            "number": 4,
+            "title": "Fix <script>&\"' handling",
+            "url": "https://github.com/example/repo/issues/4?a=1&b=\"2\"",
+            "state": "open",
+            "created_at": "2026-05-04T12:00:00Z",
+            "comments_count": 0,
+        })
+        return analyzer
+
+    def test_titles_and_urls_are_escaped_like_html_escape(self):
+        analyzer = self._analyzer()
+        issue = analyzer.stats.issues_opened[0]
+        page = "".join(analyzer.iter_html_report(7))
+
+        self.assertIn(f">{html.escape(issue['title'], quote=True)}</a>", page)
+        self.assertIn(f'href="{html.escape(issue["url"], quote=True)}"', page)
+        self.assertNotIn("<script>", page)
+
+
+class StreamedHtmlOutputTests(unittest.TestCase):
+    def test_output_file_matches_joined_report(self):
+        analyzers = []
+
+        def fake_analyze(self, days, end_date=None, since_date=None):
+            analyzers.append(self)
+            self.since_date, self.end_date = since_date, end_date
+            self.stats.issues_opened.append({
+                "number": 4,
+                "title": "Ünïcode & <tags>",
+                "url": "https://github.com/example/repo/issues/4",
+                "state": "open",
+                "created_at": "2026-05-04T12:00:00Z",
+                "comments_count": 1,
+            })
+
+        class FixedDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return cls(2026, 5, 8, 9, 30, tzinfo=tz)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "report.html")
+            argv = [
+                "github_repo_user_report.py", "example", "repo", "helms-charity",
+                "--from-date", "2026-05-01", "--to-date", "2026-05-07",
+                "--format", "html", "--output", path, "--token", "token",
+            ]
+            with patch.object(sys, "argv", argv), \
+                    patch.object(GitHubRepoUserAnalyzer, "analyze_activity", fake_analyze), \
+                    patch("github_repo_user_report.datetime", FixedDatetime), \
+                    patch("builtins.print"):
+                github_repo_user_report.main()
+                expected = analyzers[0].generate_report(7, "html")
+            with open(path, encoding="utf-8") as f:
+                written = f.read()
+
+        self.assertIn("Ünïcode &amp; &lt;tags&gt;", written)
+        self.assertEqual(written, expected)
+
+
+class DateFormattingTests(unittest.TestCase):
+    def test_fmt_date_matches_strftime(self):
+        for value in (
+            "2026-05-04T13:00:00Z",
+            "2026-01-31T23:59:59Z",  # last second of a month
+            "2026-02-01T00:00:00Z",  # first second of the next
+            "2025-12-31T12:00:00Z",
+        ):
+            with self.subTest(value=value):
+                expected = datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").strftime("%B %d, %Y")
+                self.assertEqual(_fmt_date(value), expected)
+
+    def test_fmt_date_with_offset_keeps_the_local_calendar_day(self):
+        value = "2026-03-01T00:30:00+02:00"
+        self.assertEqual(_fmt_date(value), datetime.fromisoformat(value).strftime("%B %d, %Y"))
+
+    def test_fmt_day_matches_strftime(self):
+        for day in ("2026-05-01", "2026-06-30", "2026-07-01"):
+            with self.subTest(day=day):
+                expected = datetime.strptime(day, "%Y-%m-%d").strftime("%B %d, %Y")
+                self.assertEqual(_fmt_day(day), expected)
+
+
+class CommentPreviewTests(unittest.TestCase):
+    @staticmethod
+    def _baseline(body):
+        # The preview before _first_line, compared as the browser shows it (whitespace collapsed)
+        preview = body[:100] + '...' if len(body) > 100 else body
+        return " ".join(preview.split())
+
+    def test_single_line_previews_match_the_baseline(self):
+        for body in ("short comment", "x" * 100, "y" * 101, "word " * 60):
+            with self.subTest(body=body[:20]):
+                self.assertEqual(_first_line(body, 100), self._baseline(body))
+
+    def test_leading_blank_lines_are_skipped(self):
+        body = "\n\n  \nLooks good to me"
+        self.assertEqual(_first_line(body, 100), self._baseline(body))
+        self.assertEqual(_first_line("\n\n" + "z" * 150, 100), "z" * 100 + "...")
+
+    def test_later_lines_are_cut(self):
+        self.assertEqual(_first_line("First line\nSecond line", 100), "First line...")
+        self.assertEqual(_first_line("Only line\n", 100), "Only line")
+
+    def test_empty_and_missing_bodies(self):
+        self.assertEqual(_first_line("", 100), "")
+        self.assertEqual(_first_line(None, 100), "")
+        self.assertEqual(_first_line("\n \n", 100), "")
+
+
+class JsonReportTests(unittest.TestCase):
+    TITLE = "Résumé für café ✓"
+
+    def _report(self, module):
+        analyzer = module.GitHubRepoUserAnalyzer("example", "repo", "helms-charity")
+        analyzer.stats.pull_requests_merged.append({"number": 1, "title": self.TITLE})
+        return analyzer.generate_report(7, "json")
+
+    def test_non_ascii_is_written_raw_with_and_without_orjson(self):
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "github_repo_user_report.py")
+        spec = importlib.util.spec_from_file_location("_report_without_orjson", path)
+        without_orjson = importlib.util.module_from_spec(spec)
+        with patch.dict(sys.modules, {"orjson": None}):
+            spec.loader.exec_module(without_orjson)
+
+        fallback = self._report(without_orjson)
+        default = self._report(github_repo_user_report)
+
+        self.assertIn(self.TITLE, fallback)
+        self.assertEqual(fallback, default)
+        self.assertEqual(json.loads(fallback)["pull_requests_merged"][0]["title"], self.TITLE)
+
+
 if __name__ == "__main__":
     unittest.main()